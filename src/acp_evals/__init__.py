@@ -20,13 +20,7 @@ Professional developer tools for evaluating AI agents:
 
 __version__ = "0.1.2"
 
-# The 3 core evaluation types every professional needs
-from .api import (
-    AccuracyEval,
-    EvalResult,
-    PerformanceEval,
-    ReliabilityEval,
-)
+from typing import TYPE_CHECKING
 
 # Keep config available
 from .core import config  # noqa: F401
@@ -51,3 +45,20 @@ __all__ = [
     "BenchmarkTask",
     "AgentInfo",
 ]
+
+# The 3 core evaluation types every professional needs. They are loaded on first
+# access so that importing the package (e.g. for the CLI) doesn't pull in the ACP SDK.
+_LAZY_API = frozenset({"AccuracyEval", "PerformanceEval", "ReliabilityEval", "EvalResult"})
+
+if TYPE_CHECKING:
+    from .api import AccuracyEval, EvalResult, PerformanceEval, ReliabilityEval
+
+
+def __getattr__(name: str):
+    if name in _LAZY_API:
+        from . import api
+
+        value = getattr(api, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,15 +6,13 @@ from typing import Any
 
 import click
 from rich import box
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from ..core.config import check_provider_setup, get_provider_config
 from ..core.exceptions import format_provider_setup_help
 from ..providers import ProviderFactory
-
-console = Console()
+from .display import console
 
 
 def check_env_file() -> Path | None:
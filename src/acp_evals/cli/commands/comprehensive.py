@@ -7,13 +7,10 @@ import asyncio
 from pathlib import Path
 
 import click
-from rich.console import Console
 
-from ...api import AccuracyEval, PerformanceEval, ReliabilityEval
 from ...utils.logging import get_logger
-from ..display import display_comprehensive_evaluation_results
+from ..display import console, display_comprehensive_evaluation_results
 
-console = Console()
 logger = get_logger(__name__)
 
 
@@ -64,6 +61,8 @@ def comprehensive(
             -i "Write a function to sort a list" \\
             -e "A working sort function" --rubric code_quality
     """
+    # Imported here so CLI startup and --help don't load the evaluator stack
+    from ...api import AccuracyEval, PerformanceEval, ReliabilityEval
 
     if not ctx.obj.get("quiet"):
         console.print("[bold cyan]Running Agent Evaluation[/bold cyan]")
@@ -77,7 +76,7 @@ def comprehensive(
     reliability_result = None
 
     try:
-        # Run all evaluations concurrently for efficiency
+        # Run independent evaluations concurrently for efficiency
         async def run_comprehensive_evaluation():
             tasks = []
 
@@ -88,50 +87,61 @@ def comprehensive(
                     input=input_text,
                     expected=expected,
                     print_results=False,  # We'll show unified results
+                    _disable_progress=True,  # Concurrent runs can't share a live display
                 )
                 tasks.append(("accuracy", accuracy_task))
 
-            # Performance evaluation
-            performance_eval = PerformanceEval(agent, track_tokens=track_tokens, track_memory=True)
-            performance_task = performance_eval.run(input_text=input_text, print_results=False)
-            tasks.append(("performance", performance_task))
-
             # Reliability evaluation
             reliability_eval = ReliabilityEval(agent)
             reliability_task = reliability_eval.run(
                 input=input_text,
                 expected_tools=list(expected_tools) if expected_tools else None,
                 print_results=False,
+                _disable_progress=True,
             )
             tasks.append(("reliability", reliability_task))
 
+            # Performance evaluation runs on its own so concurrent load doesn't skew latency
+            performance_eval = PerformanceEval(agent, track_tokens=track_tokens, track_memory=True)
+
+            async def run_all():
+                outcomes = list(
+                    await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
+                )
+                eval_types = [eval_type for eval_type, _ in tasks]
+                try:
+                    outcomes.append(
+                        await performance_eval.run(input_text=input_text, print_results=False)
+                    )
+                except Exception as e:
+                    outcomes.append(e)
+                eval_types.append("performance")
+                return zip(eval_types, outcomes)
+
             # Execute all tasks
-            results = {}
             if not ctx.obj.get("quiet"):
-                with console.status("[bold blue]Running evaluations...") as status:
-                    for eval_type, task in tasks:
-                        status.update(f"[bold blue]Running {eval_type} evaluation...")
-                        try:
-                            result = await task
-                            results[eval_type] = result
-                            status.update(f"[green]✓[/green] {eval_type.title()} complete")
-                        except Exception as e:
-                            logger.error(f"Failed {eval_type} evaluation: {e}")
-                            if ctx.obj.get("debug"):
-                                raise
-                            console.print(
-                                f"[yellow]Warning: {eval_type.title()} evaluation failed: {e}[/yellow]"
-                            )
+                with console.status("[bold blue]Running evaluations..."):
+                    outcomes = await run_all()
             else:
                 # Run without status in quiet mode
-                for eval_type, task in tasks:
-                    try:
-                        result = await task
-                        results[eval_type] = result
-                    except Exception as e:
-                        logger.error(f"Failed {eval_type} evaluation: {e}")
-                        if ctx.obj.get("debug"):
-                            raise
+                outcomes = await run_all()
+
+            results = {}
+            for eval_type, outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    if not isinstance(outcome, Exception):
+                        raise outcome
+                    logger.error(f"Failed {eval_type} evaluation: {outcome}")
+                    if ctx.obj.get("debug"):
+                        raise outcome
+                    if not ctx.obj.get("quiet"):
+                        console.print(
+                            f"[yellow]Warning: {eval_type.title()} evaluation failed: {outcome}[/yellow]"
+                        )
+                else:
+                    results[eval_type] = outcome
+                    if not ctx.obj.get("quiet"):
+                        console.print(f"[green]✓[/green] {eval_type.title()} complete")
 
             return results
 
@@ -1,46 +1,52 @@
 """Discover command for finding and testing ACP agents."""
 
 import asyncio
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from ...api import AccuracyEval
+from ...utils.serialization import write_json
+from ..display import console
 
-try:
-    from acp_sdk.client import Client
 
-    ACP_SDK_AVAILABLE = True
-except ImportError:
-    ACP_SDK_AVAILABLE = False
-    import aiohttp
+def _to_agent_dict(server_url: str, name: str, get: Callable[[str, Any], Any]) -> dict[str, Any]:
+    """Build the agent record shared by both discovery paths.
 
-console = Console()
+    ``get(key, default)`` reads a field from the SDK model or the raw JSON dict.
+    """
+    return {
+        "name": name,
+        "description": get("description", "No description"),
+        "version": get("version", "Unknown"),
+        "url": f"{server_url}/agents/{name}",
+        "tags": get("tags", []),
+        "framework": get("framework", "Unknown"),
+    }
 
 
 async def discover_agents(server_url: str) -> list[dict[str, Any]]:
     """Discover available agents from an ACP server."""
     try:
-        if ACP_SDK_AVAILABLE:
-            # Use official ACP SDK
-            client = Client(base_url=server_url)
-            agents = []
+        from acp_sdk.client import Client
+
+        acp_sdk_available = True
+    except ImportError:
+        acp_sdk_available = False
+        import aiohttp
 
-            # Use async iterator to get agents
-            async for agent in client.agents():
-                agent_dict = {
-                    "name": agent.name,
-                    "description": getattr(agent, "description", "No description"),
-                    "version": getattr(agent, "version", "Unknown"),
-                    "url": f"{server_url}/agents/{agent.name}",
-                    "tags": getattr(agent, "tags", []),
-                    "framework": getattr(agent, "framework", "Unknown"),
-                }
-                agents.append(agent_dict)
+    try:
+        if acp_sdk_available:
+            # Use official ACP SDK; the context manager closes its connection pool
+            agents = []
+            async with Client(base_url=server_url) as client:
+                # Use async iterator to get agents
+                async for agent in client.agents():
+                    agents.append(_to_agent_dict(server_url, agent.name, partial(getattr, agent)))
 
             return agents
         else:
@@ -49,24 +55,15 @@ async def discover_agents(server_url: str) -> list[dict[str, Any]]:
                 async with session.get(f"{server_url}/agents") as response:
                     if response.status == 200:
                         data = await response.json()
-                        agents = []
 
                         # Handle different response formats
                         agent_data = data if isinstance(data, list) else data.get("agents", [])
 
-                        for agent in agent_data:
-                            if isinstance(agent, dict):
-                                agent_dict = {
-                                    "name": agent.get("name", "Unknown"),
-                                    "description": agent.get("description", "No description"),
-                                    "version": agent.get("version", "Unknown"),
-                                    "url": f"{server_url}/agents/{agent.get('name', 'unknown')}",
-                                    "tags": agent.get("tags", []),
-                                    "framework": agent.get("framework", "Unknown"),
-                                }
-                                agents.append(agent_dict)
-
-                        return agents
+                        return [
+                            _to_agent_dict(server_url, agent.get("name", "Unknown"), agent.get)
+                            for agent in agent_data
+                            if isinstance(agent, dict)
+                        ]
                     else:
                         console.print(f"[red]Server returned status {response.status}[/red]")
                         return []
@@ -78,12 +75,16 @@ async def discover_agents(server_url: str) -> list[dict[str, Any]]:
 
 async def test_agent(agent_url: str, agent_name: str) -> dict[str, Any]:
     """Run a quick test on an agent."""
+    from ...api import AccuracyEval
+
+    eval_instance = None
     try:
         # Simple test
         eval_instance = AccuracyEval(agent=agent_url)
         result = await eval_instance.run(
             input="What is 2+2?",
             expected="4",
+            _disable_progress=True,  # Tests run concurrently under one progress display
         )
 
         return {
@@ -101,6 +102,32 @@ async def test_agent(agent_url: str, agent_name: str) -> dict[str, Any]:
             "status": "error",
             "error": str(e),
         }
+    finally:
+        if eval_instance is not None:
+            await eval_instance._cleanup()
+
+
+async def test_agents(
+    agents: list[dict[str, Any]], max_concurrency: int, on_done=None
+) -> list[dict[str, Any]]:
+    """Test agents concurrently in one event loop, capping in-flight tests.
+
+    Results are returned in the same order as ``agents``.
+    """
+    from ...evaluators.common import shared_clients
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(agent: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            result = await test_agent(agent["url"], agent["name"])
+        if on_done:
+            on_done(agent)
+        return result
+
+    # Agents on the same server share one client for the whole run
+    async with shared_clients():
+        return list(await asyncio.gather(*(_bounded(agent) for agent in agents)))
 
 
 def display_agents(
@@ -192,14 +219,28 @@ def display_agents(
     "-f",
     help="Filter agents by name pattern",
 )
+@click.option(
+    "--max-concurrency",
+    default=8,
+    type=click.IntRange(min=1),
+    help="Maximum number of agents tested at once with --test-all",
+)
 @click.pass_context
-def discover(ctx, server: str, test_all: bool, export: str | None, filter: str | None) -> None:
+def discover(
+    ctx,
+    server: str,
+    test_all: bool,
+    export: str | None,
+    filter: str | None,
+    max_concurrency: int,
+) -> None:
     """Discover and list available ACP agents.
 
     Examples:
         acp-evals discover
         acp-evals discover --server http://acp.example.com
         acp-evals discover --test-all
+        acp-evals discover --test-all --max-concurrency 4
         acp-evals discover --filter "research*" --export agents.json
     """
     # Get flags from context
@@ -231,30 +272,31 @@ def discover(ctx, server: str, test_all: bool, export: str | None, filter: str |
     if test_all:
         console.print("[bold]Testing all agents...[/bold]\n")
 
-        test_results = []
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
         ) as progress:
-            task = progress.add_task("Testing agents...", total=len(agents))
+            task = progress.add_task(f"Testing agents (0/{len(agents)})", total=len(agents))
+            completed = 0
 
-            for i, agent in enumerate(agents):
+            def on_done(agent: dict[str, Any]) -> None:
+                nonlocal completed
+                completed += 1
                 progress.update(
                     task,
-                    description=f"Testing {agent['name']} ({i + 1}/{len(agents)})",
+                    advance=1,
+                    description=f"Tested {agent['name']} ({completed}/{len(agents)})",
                 )
 
-                result = asyncio.run(test_agent(agent["url"], agent["name"]))
-                test_results.append(result)
+            # One event loop for all tests instead of a fresh loop per agent
+            test_results = asyncio.run(test_agents(agents, max_concurrency, on_done))
 
     # Display results
     display_agents(agents, test_results)
 
     # Export if requested
     if export:
-        import json
-
         export_data = {
             "server": server,
             "agents": agents,
@@ -263,8 +305,7 @@ def discover(ctx, server: str, test_all: bool, export: str | None, filter: str |
         if test_results:
             export_data["test_results"] = test_results
 
-        with open(export, "w") as f:
-            json.dump(export_data, f, indent=2)
+        write_json(export, export_data)
 
         console.print(f"\n[green]Agents exported to:[/green] {export}")
 
@@ -10,15 +10,12 @@ import sys
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 from rich.text import Text
 
 from ...core import config
-from ..display import create_evaluation_header
-
-console = Console()
+from ..display import console, create_evaluation_header
 
 
 @click.command("quick-start")
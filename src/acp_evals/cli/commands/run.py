@@ -1,17 +1,14 @@
 """Run command for direct evaluation from CLI."""
 
 import asyncio
-import json
 from typing import Any
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from ...api import AccuracyEval, PerformanceEval, ReliabilityEval
-
-console = Console()
+from ...utils.serialization import write_json
+from ..display import console
 
 
 def format_result(result: Any) -> None:
@@ -103,6 +100,9 @@ def run(
         acp-evals run performance my-agent -i "Complex task" --track-tokens
         acp-evals run reliability my-agent -i "Use search tool" --expected-tools search
     """
+    # Imported here so CLI startup and --help don't load the evaluator stack
+    from ...api import AccuracyEval, PerformanceEval, ReliabilityEval
+
     # Get quiet mode from context
     quiet = ctx.obj.get("quiet", False)
     ctx.obj.get("verbose", False)
@@ -175,8 +175,7 @@ def run(
                 },
             }
 
-            with open(export, "w") as f:
-                json.dump(export_data, f, indent=2)
+            write_json(export, export_data)
 
             if not quiet:
                 console.print(f"\n[green]Result exported to:[/green] {export}")
@@ -97,22 +97,27 @@ def create_test_details_tree(test_results: list[dict[str, Any]]) -> Panel:
     lines.append(f"Test Details ({passed_tests} passed, {total_tests - passed_tests} failed)\n")
 
     # Individual tests
+    last_index = total_tests - 1
+    append = lines.append
     for i, test in enumerate(test_results):
-        is_last = i == len(test_results) - 1
+        is_last = i == last_index
         prefix = "└── " if is_last else "├── "
 
-        status = "[green]✓[/green]" if test.get("passed") else "[red]✗[/red]"
+        passed = test.get("passed")
+        status = "[green]✓[/green]" if passed else "[red]✗[/red]"
         score = test.get("score", 0)
         score_color = get_score_color(score)
 
-        lines.append(
+        append(
             f"{prefix}{status} {test['name']} → Score: [{score_color}]{score:.2f}[/{score_color}]"
         )
 
         # Add details if test failed
-        if not test.get("passed") and test.get("reason"):
-            detail_prefix = "    " if is_last else "│   "
-            lines.append(f"{detail_prefix}└── {test['reason']}")
+        if not passed:
+            reason = test.get("reason")
+            if reason:
+                detail_prefix = "    " if is_last else "│   "
+                append(f"{detail_prefix}└── {reason}")
 
     return Panel(
         "\n".join(lines), title="Test Results", border_style="yellow", box=ROUNDED, padding=(1, 2)
@@ -216,16 +221,18 @@ def create_comparison_table(agents: list[str], results: dict[str, dict[str, floa
     for agent_results in results.values():
         all_metrics.update(agent_results.keys())
 
+    # Resolve each agent's results once rather than per metric
+    per_agent = [results.get(agent, {}) for agent in agents]
+
     # Add rows
     for metric in sorted(all_metrics):
         row = [metric.replace("_", " ").title()]
 
-        # Find best score for highlighting
-        scores = [results.get(agent, {}).get(metric, 0) for agent in agents]
-        best_score = max(scores) if scores else 0
+        # Collect scores once; reused for best-score highlighting and the cells
+        scores = [r.get(metric, 0) for r in per_agent]
+        best_score = max(scores, default=0)
 
-        for agent in agents:
-            score = results.get(agent, {}).get(metric, 0)
+        for score in scores:
             color = "green" if score == best_score and score > 0 else get_score_color(score)
             bar = create_score_bar(score, width=10)
             row.append(f"{bar}\n[{color}]{score:.2f}[/{color}]")
@@ -7,11 +7,8 @@ import os
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.prompt import Confirm, Prompt
 
-console = Console()
-
 # Import commands
 # Import logging setup
 from ..utils.logging import setup_logging
@@ -20,6 +17,9 @@ from .commands.discover import discover
 from .commands.run import run
 from .commands.test import test
 
+# Shared with every command so --quiet/--verbose apply to all CLI output
+from .display import console
+
 
 @click.group()
 @click.option("-v", "--verbose", is_flag=True, help="Show detailed output")
@@ -116,7 +116,7 @@ def init(ctx, template, name, output, interactive):
         console.print("[bold cyan]ACP Evaluations Template Generator[/bold cyan]\n")
 
     # Load templates from external file for maintainability
-    from .templates import TEMPLATES
+    from .templates import render_template
 
     # Interactive mode
     if interactive:
@@ -136,14 +136,12 @@ def init(ctx, template, name, output, interactive):
     agent_function = name.lower().replace(" ", "_")
     agent_class = name.replace(" ", "")
 
-    # Get template
-    template_content = TEMPLATES[template]
-
     # Customize template
     replacements = {
-        "{agent_name}": name,
-        "{agent_function}": agent_function,
-        "{agent_class}": agent_class,
+        "agent_name": name,
+        "agent_function": agent_function,
+        "agent_class": agent_class,
+        "agent_url": "http://localhost:8000/agents/my-agent",
     }
 
     # Additional prompts for comprehensive template
@@ -155,36 +153,34 @@ def init(ctx, template, name, output, interactive):
         )
 
         if rubric_choice == "custom":
-            replacements["{rubric_choice}"] = """{
+            replacements["rubric_choice"] = """{
             "accuracy": {"weight": 0.5, "criteria": "Is the response accurate?"},
             "completeness": {"weight": 0.3, "criteria": "Is the response complete?"},
             "clarity": {"weight": 0.2, "criteria": "Is the response clear?"}
         }"""
         else:
-            replacements["{rubric_choice}"] = f'"{rubric_choice}"'
+            replacements["rubric_choice"] = f'"{rubric_choice}"'
 
-        replacements["{sample_input}"] = Prompt.ask(
+        replacements["sample_input"] = Prompt.ask(
             "Sample test input", default="What is the capital of France?"
         )
-        replacements["{sample_expected}"] = Prompt.ask("Expected output", default="Paris")
+        replacements["sample_expected"] = Prompt.ask("Expected output", default="Paris")
     else:
         # Defaults for non-interactive mode
-        replacements["{rubric_choice}"] = '"factual"'
-        replacements["{sample_input}"] = "What is the capital of France?"
-        replacements["{sample_expected}"] = "Paris"
+        replacements["rubric_choice"] = '"factual"'
+        replacements["sample_input"] = "What is the capital of France?"
+        replacements["sample_expected"] = "Paris"
 
     # Additional replacements for ACP and multi-agent templates
     if template == "acp-agent":
-        replacements["{agent_url}"] = "http://localhost:8000/agents/my-agent"
-        replacements["{base_url}"] = "http://localhost:8000"
+        replacements["base_url"] = "http://localhost:8000"
     elif template == "multi-agent":
-        replacements["{researcher_url}"] = "http://localhost:8000/agents/researcher"
-        replacements["{analyst_url}"] = "http://localhost:8000/agents/analyst"
-        replacements["{writer_url}"] = "http://localhost:8000/agents/writer"
+        replacements["researcher_url"] = "http://localhost:8000/agents/researcher"
+        replacements["analyst_url"] = "http://localhost:8000/agents/analyst"
+        replacements["writer_url"] = "http://localhost:8000/agents/writer"
 
-    # Apply replacements
-    for key, value in replacements.items():
-        template_content = template_content.replace(key, value)
+    # Render the precompiled template in a single pass
+    template_content = render_template(template, **replacements)
 
     # Check if file exists
     output_path = Path(output)
@@ -250,14 +246,13 @@ def list_rubrics(ctx):
 @click.pass_context
 def report(ctx, results_file, format):
     """Generate a report from evaluation results."""
-    import json
-
     from rich.markdown import Markdown
     from rich.table import Table
 
+    from ..utils.serialization import loads_json
+
     # Load results
-    with open(results_file) as f:
-        data = json.load(f)
+    data = loads_json(Path(results_file).read_bytes())
 
     if format == "summary":
         # Summary table
@@ -288,7 +283,8 @@ def report(ctx, results_file, format):
 
     elif format == "markdown":
         # Markdown report
-        md_content = f"""# Evaluation Report
+        md_parts = [
+            f"""# Evaluation Report
 
 ## Summary
 - **Total Tests**: {data.get("summary", {}).get("total", 0)}
@@ -299,18 +295,19 @@ def report(ctx, results_file, format):
 
 ## Detailed Results
 """
+        ]
 
         for i, result in enumerate(data.get("results", [])):
-            md_content += f"""
+            md_parts.append(f"""
 ### Test {i + 1}
 - **Status**: {"Passed" if result["passed"] else "Failed"}
 - **Score**: {result["score"]:.2f}
 - **Input**: `{result.get("metadata", {}).get("input", "N/A")}`
 - **Expected**: `{result.get("metadata", {}).get("expected", "N/A")}`
 - **Feedback**: {result.get("details", {}).get("feedback", "N/A")}
-"""
+""")
 
-        console.print(Markdown(md_content))
+        console.print(Markdown("".join(md_parts)))
 
 
 def main():
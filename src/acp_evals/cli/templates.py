@@ -1,5 +1,7 @@
 """Templates for the init command."""
 
+import string
+
 TEMPLATES = {
     "simple": """#!/usr/bin/env python3
 \"\"\"
@@ -118,9 +120,9 @@ async def run_comprehensive_evaluation():
 
     # Summary
     print("\\n=== Evaluation Summary ===")
-    print(f"Accuracy: {{accuracy_result.score:.2f}} ({'PASS' if accuracy_result.passed else 'FAIL'}})")
-    print(f"Performance: {{perf_result.score:.2f}} ({'PASS' if perf_result.passed else 'FAIL'}})")
-    print(f"Reliability: {{reliability_result.score:.2f}} ({'PASS' if reliability_result.passed else 'FAIL'}})")
+    print(f"Accuracy: {{accuracy_result.score:.2f}} ({{'PASS' if accuracy_result.passed else 'FAIL'}})")
+    print(f"Performance: {{perf_result.score:.2f}} ({{'PASS' if perf_result.passed else 'FAIL'}})")
+    print(f"Reliability: {{reliability_result.score:.2f}} ({{'PASS' if reliability_result.passed else 'FAIL'}})")
 
     overall = (accuracy_result.score + perf_result.score + reliability_result.score) / 3
     print(f"\\nOverall Score: {{overall:.2f}}")
@@ -387,3 +389,33 @@ if __name__ == "__main__":
     asyncio.run(evaluate_acp_agent())
 """,
 }
+
+
+def _compile(body: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a template into (literal, field) pairs, undoubling escaped braces."""
+    return tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(body))
+
+
+# Parsed once at import so init only has to join the pieces
+_COMPILED = {name: _compile(body) for name, body in TEMPLATES.items()}
+
+
+def render_template(name: str, **values: str) -> str:
+    """
+    Render a template with the given placeholder values.
+
+    Placeholders without a value are left in place as ``{field}``.
+
+    Args:
+        name: Template name (key of TEMPLATES)
+        **values: Placeholder values, e.g. agent_name and agent_url
+
+    Returns:
+        Rendered template source
+    """
+    parts = []
+    for literal, field in _COMPILED[name]:
+        parts.append(literal)
+        if field is not None:
+            parts.append(values.get(field, f"{{{field}}}"))
+    return "".join(parts)
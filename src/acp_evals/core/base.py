@@ -78,15 +78,25 @@ class BenchmarkTask:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentInfo:
-    """Information about an agent."""
+    """Information about an agent.
+
+    Instances are immutable and hashable, so they can key dicts and sets.
+    Capabilities are stored as a tuple; metadata is left out of equality and
+    hashing.
+    """
 
     name: str
     url: str
     role: str
-    capabilities: list[str] = field(default_factory=list)
-    metadata: dict = field(default_factory=dict)
+    capabilities: tuple[str, ...] = ()
+    metadata: dict = field(default_factory=dict, compare=False)
+
+    def __post_init__(self):
+        # Accept any iterable of capabilities (e.g. a list) but store a tuple
+        if not isinstance(self.capabilities, tuple):
+            object.__setattr__(self, "capabilities", tuple(self.capabilities))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -94,6 +104,6 @@ class AgentInfo:
             "name": self.name,
             "url": self.url,
             "role": self.role,
-            "capabilities": self.capabilities,
+            "capabilities": list(self.capabilities),
             "metadata": self.metadata,
         }
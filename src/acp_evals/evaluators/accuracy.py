@@ -262,6 +262,7 @@ class AccuracyEval(BaseEval):
         progress: bool = True,
         export: str | None = None,
         print_results: bool = True,
+        max_concurrency: int | None = None,
     ) -> BatchResult:
         """
         Run multiple evaluations.
@@ -272,6 +273,8 @@ class AccuracyEval(BaseEval):
             progress: Show progress bar
             export: Path to export results
             print_results: Print summary
+            max_concurrency: Maximum test cases evaluated at once when running
+                in parallel (unbounded if None)
 
         Returns:
             BatchResult with aggregated metrics
@@ -280,65 +283,46 @@ class AccuracyEval(BaseEval):
         if isinstance(test_cases, str | Path):
             test_cases = self._load_test_cases(test_cases)
 
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run_case(test: dict[str, Any]) -> EvalResult:
+            coro = self.run(
+                input=test["input"],
+                expected=test.get("expected", test.get("expected_output", "")),
+                context=test.get("context"),
+                print_results=False,
+                _disable_progress=True,
+            )
+            if semaphore is None:
+                return await coro
+            async with semaphore:
+                return await coro
+
         results = []
 
         if progress:
             with Progress(console=console) as prog:
                 task = prog.add_task("Running evaluations...", total=len(test_cases))
 
+                async def run_and_advance(test: dict[str, Any]) -> EvalResult:
+                    result = await run_case(test)
+                    prog.advance(task)
+                    return result
+
                 if parallel:
-                    # Run in parallel
-                    tasks = []
-                    for i, test in enumerate(test_cases):
-                        coro = self.run(
-                            input=test["input"],
-                            expected=test.get("expected", test.get("expected_output", "")),
-                            context=test.get("context"),
-                            print_results=False,
-                            _disable_progress=True,
-                        )
-                        tasks.append(coro)
-
-                    for future in asyncio.as_completed(tasks):
-                        result = await future
-                        results.append(result)
-                        prog.advance(task)
+                    # Run in parallel; gather keeps results in test case order
+                    results = await asyncio.gather(*(run_and_advance(t) for t in test_cases))
                 else:
                     # Run sequentially
                     for test in test_cases:
-                        result = await self.run(
-                            input=test["input"],
-                            expected=test.get("expected", test.get("expected_output", "")),
-                            context=test.get("context"),
-                            print_results=False,
-                            _disable_progress=True,
-                        )
-                        results.append(result)
-                        prog.advance(task)
+                        results.append(await run_and_advance(test))
         else:
             # No progress bar
             if parallel:
-                tasks = [
-                    self.run(
-                        input=test["input"],
-                        expected=test.get("expected", test.get("expected_output", "")),
-                        context=test.get("context"),
-                        print_results=False,
-                        _disable_progress=True,
-                    )
-                    for test in test_cases
-                ]
-                results = await asyncio.gather(*tasks)
+                results = await asyncio.gather(*(run_case(t) for t in test_cases))
             else:
                 for test in test_cases:
-                    result = await self.run(
-                        input=test["input"],
-                        expected=test.get("expected", test.get("expected_output", "")),
-                        context=test.get("context"),
-                        print_results=False,
-                        _disable_progress=True,
-                    )
-                    results.append(result)
+                    results.append(await run_case(test))
 
         batch_result = BatchResult(results)
 
@@ -383,12 +367,9 @@ class AccuracyEval(BaseEval):
         path = Path(path)
 
         if path.suffix == ".jsonl":
-            # JSONL format
-            test_cases = []
+            # JSONL format, one test case per non-blank line
             with open(path) as f:
-                for line in f:
-                    test_cases.append(json.loads(line))
-            return test_cases
+                return [json.loads(line) for line in f if line.strip()]
 
         elif path.suffix == ".json":
             # JSON array
@@ -3,8 +3,11 @@ Common classes and utilities for evaluators.
 """
 
 import asyncio
+import contextlib
+import os
 import time
-from collections.abc import Callable
+import weakref
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
 from typing import Any
 
@@ -16,6 +19,7 @@ from rich.table import Table
 
 from ..core.exceptions import AgentConnectionError, AgentTimeoutError
 from ..core.validation import InputValidator
+from ..utils.serialization import dumps_json
 
 # Import display components conditionally to avoid circular imports
 try:
@@ -38,10 +42,16 @@ except ImportError:
 # Use display console if available, otherwise create new one
 console = display_console
 
+# Batch exports can be large; write them through a 1 MiB buffer
+_EXPORT_BUFFER_SIZE = 1 << 20
+
 
 class EvalResult:
     """Simple result container with pretty printing."""
 
+    # Detail keys rendered specially (or hidden) in print_summary
+    _SUMMARY_SKIP_KEYS = frozenset({"feedback", "scores", "latency_ms"})
+
     def __init__(
         self,
         name: str,
@@ -55,7 +65,20 @@ class EvalResult:
         self.score = score
         self.details = details
         self.metadata = metadata or {}
-        self.timestamp = datetime.now()
+        # Record creation time cheaply; the datetime is only built if someone asks
+        self._created_ns = time.time_ns()
+        self._timestamp: datetime | None = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Local time at which the result was created."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._created_ns / 1e9)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
 
     def __repr__(self):
         return f"EvalResult(name='{self.name}', passed={self.passed}, score={self.score:.2f})"
@@ -98,9 +121,12 @@ class EvalResult:
                         content_lines.append(f"  {criterion}: {criterion_bar} {score:.2f}")
 
                 # Add other details
-                for key, value in self.details.items():
-                    if key not in ["feedback", "scores", "latency_ms"]:
-                        content_lines.append(f"\n{key.replace('_', ' ').title()}: {value}")
+                skip = self._SUMMARY_SKIP_KEYS
+                content_lines.extend(
+                    f"\n{key.replace('_', ' ').title()}: {value}"
+                    for key, value in self.details.items()
+                    if key not in skip
+                )
 
             # Create and display panel
             panel = Panel(
@@ -127,6 +153,9 @@ class EvalResult:
 class BatchResult:
     """Container for batch evaluation results."""
 
+    # Column schema of the plain summary table as (header, style)
+    _COLUMNS = (("Metric", "cyan"), ("Value", "magenta"))
+
     def __init__(self, results: list[EvalResult]):
         self.results = results
         self.total = len(results)
@@ -137,7 +166,10 @@ class BatchResult:
 
     def print_summary(self):
         """Print an enhanced summary of batch results."""
-        if HAS_DISPLAY:
+        if not console.is_terminal:
+            # Piped or redirected (e.g. CI logs): skip panel and markup rendering
+            self._print_plain_summary()
+        elif HAS_DISPLAY:
             # Use enhanced display components
             # Header
             console.print()
@@ -187,10 +219,7 @@ class BatchResult:
                 console.print(details_panel)
         else:
             # Fallback to simple table display
-            table = Table(title="Batch Evaluation Results")
-            table.add_column("Metric", style="cyan")
-            table.add_column("Value", style="magenta")
-
+            table = self._make_table()
             table.add_row("Total Tests", str(self.total))
             table.add_row("Passed", f"[green]{self.passed}[/green]")
             table.add_row("Failed", f"[red]{self.failed}[/red]")
@@ -199,37 +228,184 @@ class BatchResult:
 
             console.print(table)
 
-    def export(self, path: str):
-        """Export results to JSON file."""
-        import json
-
-        data = {
-            "summary": {
-                "total": self.total,
-                "passed": self.passed,
-                "failed": self.failed,
-                "pass_rate": self.pass_rate,
-                "avg_score": self.avg_score,
-            },
-            "results": [
-                {
-                    "name": r.name,
-                    "passed": r.passed,
-                    "score": r.score,
-                    "details": r.details,
-                    "metadata": r.metadata,
-                    "timestamp": r.timestamp.isoformat(),
-                }
-                for r in self.results
-            ],
+    def _print_plain_summary(self):
+        """Print the batch summary as plain text lines in a single write."""
+        lines = [
+            "Batch Evaluation Results",
+            f"Total Tests: {self.total}",
+            f"Passed: {self.passed}",
+            f"Failed: {self.failed}",
+            f"Pass Rate: {self.pass_rate:.1f}%",
+            f"Average Score: {self.avg_score:.2f}",
+        ]
+        lines.extend(
+            f"{'PASS' if r.passed else 'FAIL'} {r.name}: {r.score:.2f}" for r in self.results
+        )
+        print("\n".join(lines), file=console.file)
+
+    @classmethod
+    def _make_table(cls, title: str = "Batch Evaluation Results") -> Table:
+        """Create an empty summary table with the shared column schema."""
+        table = Table(title=title)
+        for header, style in cls._COLUMNS:
+            table.add_column(header, style=style)
+        return table
+
+    def _summary_record(self) -> dict[str, Any]:
+        """Summary fields written at the top of an export."""
+        return {
+            "total": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "pass_rate": self.pass_rate,
+            "avg_score": self.avg_score,
         }
 
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+    @staticmethod
+    def _result_record(result: EvalResult) -> dict[str, Any]:
+        """Serializable form of a single result."""
+        return {
+            "name": result.name,
+            "passed": result.passed,
+            "score": result.score,
+            "details": result.details,
+            "metadata": result.metadata,
+            "timestamp": result.timestamp.isoformat(),
+        }
+
+    def export(self, path: str):
+        """Export results to JSON file.
+
+        Results are serialized and written one at a time through a buffered
+        file, so the whole document is never held in memory at once.
+        """
+
+        def nested(value: Any, indent: bytes) -> bytes:
+            # Indented JSON re-indented for a value nested at this depth
+            return dumps_json(value).replace(b"\n", b"\n" + indent)
+
+        with open(path, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+            f.write(b'{\n  "summary": ')
+            f.write(nested(self._summary_record(), b"  "))
+            f.write(b',\n  "results": [')
+            for i, result in enumerate(self.results):
+                f.write(b",\n    " if i else b"\n    ")
+                f.write(nested(self._result_record(result), b"    "))
+            f.write(b"\n  ]\n}" if self.results else b"]\n}")
+
+        console.print(f"\n[green]Results exported to {path}[/green]")
+
+    def export_jsonl(self, path: str):
+        """Export results as JSON Lines, one compact result object per line."""
+        with open(path, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+            for result in self.results:
+                f.write(dumps_json(self._result_record(result), indent=False))
+                f.write(b"\n")
 
         console.print(f"\n[green]Results exported to {path}[/green]")
 
 
+# Run-status polling starts short and backs off, so runs that finish quickly
+# aren't padded by a fixed sleep while long runs don't hammer the server
+_POLL_INITIAL_DELAY = 0.005
+_POLL_MAX_DELAY = 0.1
+_TERMINAL_RUN_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# ACP clients shared by every evaluator that targets the same server, so evaluators
+# reuse one connection pool. httpx pools are bound to the event loop they were
+# created on, so clients are pooled per loop; each entry is [client, refcount].
+_CLIENT_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, list]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Concurrent runs allowed against one agent URL (ACP_PER_AGENT_CONCURRENCY
+# overrides), so concurrent evaluators queue instead of overloading an agent.
+# Semaphores are bound to the loop they're used on, so they're kept per loop.
+_DEFAULT_PER_AGENT_CONCURRENCY = 8
+_AGENT_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Loops inside a shared_clients() block, where idle clients stay open for reuse
+_PINNED_LOOPS: "weakref.WeakSet[asyncio.AbstractEventLoop]" = weakref.WeakSet()
+
+
+def _acquire_client(base_url: str) -> Client:
+    """Return the shared ACP client for base_url on the running loop."""
+    pool = _CLIENT_POOLS.setdefault(asyncio.get_running_loop(), {})
+    entry = pool.get(base_url)
+    if entry is None:
+        entry = pool[base_url] = [Client(base_url=base_url), 0]
+    entry[1] += 1
+    return entry[0]
+
+
+async def _release_client(base_url: str, client: Client) -> None:
+    """Drop one reference to a shared client, closing it with the last one."""
+    pool = _CLIENT_POOLS.get(asyncio.get_running_loop(), {})
+    entry = pool.get(base_url)
+    if entry is None or entry[0] is not client:
+        # close_shared_clients already closed it
+        return
+    entry[1] -= 1
+    if entry[1] > 0 or asyncio.get_running_loop() in _PINNED_LOOPS:
+        return
+    del pool[base_url]
+    await client.__aexit__(None, None, None)
+
+
+async def close_shared_clients() -> None:
+    """Close every shared ACP client on the running loop, whatever its refcount."""
+    pool = _CLIENT_POOLS.pop(asyncio.get_running_loop(), {})
+    for client, _ in pool.values():
+        await client.__aexit__(None, None, None)
+
+
+@contextlib.asynccontextmanager
+async def shared_clients() -> AsyncIterator[None]:
+    """
+    Keep shared ACP clients open across evaluators until the block exits.
+
+    Evaluators that run one after another against the same server then reuse a
+    single connection pool instead of closing it when each one finishes.
+    """
+    loop = asyncio.get_running_loop()
+    _PINNED_LOOPS.add(loop)
+    try:
+        yield
+    finally:
+        _PINNED_LOOPS.discard(loop)
+        await close_shared_clients()
+
+
+def _agent_semaphore(agent_url: str) -> asyncio.Semaphore:
+    """Return the semaphore capping concurrent runs against agent_url on this loop."""
+    limits = _AGENT_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    semaphore = limits.get(agent_url)
+    if semaphore is None:
+        limit = int(os.getenv("ACP_PER_AGENT_CONCURRENCY", _DEFAULT_PER_AGENT_CONCURRENCY))
+        semaphore = limits[agent_url] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+# Content type of every message evaluators send to ACP agents
+_TEXT_PLAIN = "text/plain"
+
+
+def _text_message(content: str) -> Message:
+    """Build a single-part text/plain ACP message."""
+    return Message(parts=[MessagePart(content=content, content_type=_TEXT_PLAIN)])
+
+
+def _extract_response_text(run: Any) -> str:
+    """Join the text content of all output message parts of an ACP run."""
+    if not run.output:
+        return ""
+    return "\n".join(
+        part.content for msg in run.output for part in msg.parts if part.content
+    ).strip()
+
+
 class BaseEval:
     """Base class for all simple evaluators."""
 
@@ -251,15 +427,33 @@ class BaseEval:
         self.agent = agent
         self.name = name
         self._client = None
+        self._client_loop = None
+
+        # Parse agent URLs once rather than on every run (both empty for other agents)
+        url = agent if isinstance(agent, str) else ""
+        self._base_url = url.rsplit("/agents", 1)[0]
+        self._agent_name = url.split("/agents/")[-1]
 
     async def _get_client(self) -> Client | None:
-        """Get or create ACP client if agent is a URL."""
+        """Get the shared ACP client for this agent's server if agent is a URL."""
         if isinstance(self.agent, str):
-            if not self._client:
-                self._client = Client(base_url=self.agent.rsplit("/agents", 1)[0])
+            loop = asyncio.get_running_loop()
+            # Re-acquire when reused under a new event loop (e.g. a second asyncio.run)
+            if not self._client or self._client_loop is not loop:
+                self._client = _acquire_client(self._base_url)
+                self._client_loop = loop
             return self._client
         return None
 
+    async def _wait_for_run(self, client: Client, run: Any) -> Any:
+        """Poll an ACP run with exponential backoff until it reaches a terminal status."""
+        delay = _POLL_INITIAL_DELAY
+        while run.status not in _TERMINAL_RUN_STATUSES:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _POLL_MAX_DELAY)
+            run = await client.run_status(run_id=run.run_id)
+        return run
+
     async def _run_agent(self, input_text: str, **kwargs) -> dict[str, Any]:
         """Run the agent and return response with metadata."""
         start_time = time.time()
@@ -268,22 +462,23 @@ class BaseEval:
             if self.agent.startswith(("http://", "https://")):
                 # Agent is a URL - use ACP client
                 client = await self._get_client()
-                agent_name = self.agent.split("/agents/")[-1]
+                if not client:
+                    raise ValueError("Failed to create ACP client")
+                agent_name = self._agent_name
 
-                message = Message(
-                    parts=[MessagePart(content=input_text, content_type="text/plain")]
-                )
+                message = _text_message(input_text)
 
-                try:
-                    run = await client.run_sync(agent=agent_name, input=[message], **kwargs)
-                except Exception as e:
-                    # Wrap connection errors
-                    raise AgentConnectionError(self.agent, e)
+                async with _agent_semaphore(self.agent):
+                    # Time the run itself, not the wait for a free slot
+                    start_time = time.time()
+                    try:
+                        run = await client.run_sync(agent=agent_name, input=[message], **kwargs)
+                    except Exception as e:
+                        # Wrap connection errors
+                        raise AgentConnectionError(self.agent, e)
 
-                # Wait for completion
-                while run.status not in ["completed", "failed", "cancelled"]:
-                    await asyncio.sleep(0.1)
-                    run = await client.run_status(run_id=run.run_id)
+                    # Wait for completion
+                    run = await self._wait_for_run(client, run)
 
                 if run.status != "completed":
                     if run.status == "timeout":
@@ -293,16 +488,8 @@ class BaseEval:
                             self.agent, Exception(f"Agent run failed with status: {run.status}")
                         )
 
-                # Extract response text
-                response_text = ""
-                if run.output:
-                    for msg in run.output:
-                        for part in msg.parts:
-                            if part.content:
-                                response_text += part.content + "\n"
-
                 return {
-                    "response": response_text.strip(),
+                    "response": _extract_response_text(run),
                     "run_id": str(run.run_id),
                     "latency_ms": (time.time() - start_time) * 1000,
                     "status": run.status,
@@ -429,5 +616,8 @@ class BaseEval:
     async def _cleanup(self):
         """Cleanup resources."""
         if self._client:
-            await self._client.__aexit__(None, None, None)
+            # A client from an earlier event loop can't be closed from this one
+            if self._client_loop is asyncio.get_running_loop():
+                await _release_client(self._base_url, self._client)
             self._client = None
+            self._client_loop = None
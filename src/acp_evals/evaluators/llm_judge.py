@@ -1,14 +1,171 @@
 """LLM Judge for evaluating agent outputs."""
 
 import asyncio
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from pydantic import BaseModel, ValidationError
+
 from ..providers.base import LLMProvider
 from ..providers.factory import ProviderFactory
+from ..utils.serialization import loads_json
+
+# Instructions shared by every evaluation request. Keeping them byte-identical and
+# ahead of the per-case fields lets provider-side prompt caching reuse the prefix.
+_EVAL_PROMPT_PREFIX = """
+You are an expert evaluator. Please evaluate the response below based on the expected output.
+
+Please score the response from 0.0 to 1.0 based on how well it matches the expected output.
+Consider:
+- Factual accuracy
+- Completeness
+- Relevance
+
+Respond with a single JSON object and nothing else:
+{"score": <number from 0.0 to 1.0>, "feedback": "<brief explanation>"}
+"""
+
+# Per-case fields appended to the prompt prefix; the Expected line is dropped when
+# there is no expected output rather than sent empty
+_EVAL_CASE_TEMPLATE = "\nInput: {input}\nResponse: {response}\nExpected: {expected}\n"
+_EVAL_CASE_TEMPLATE_NO_EXPECTED = "\nInput: {input}\nResponse: {response}\n"
+
+# Instructions for judging several numbered cases in one request
+_PACKED_PROMPT_PREFIX = """
+You are an expert evaluator. Please evaluate each numbered response below based on its expected output.
+
+Please score each response from 0.0 to 1.0 based on how well it matches its expected output.
+Consider:
+- Factual accuracy
+- Completeness
+- Relevance
+
+Respond with a single JSON object and nothing else, holding one verdict per item:
+{"verdicts": [{"id": <item number>, "score": <number from 0.0 to 1.0>, "feedback": "<brief explanation>"}]}
+"""
 
+# Completion budget per case in a packed request
+_PACKED_TOKENS_PER_ITEM = 200
 
-@dataclass
+# Verdict lines ("Score: 0.8" / "- Feedback: ..."), for judges that ignore the JSON
+# instruction; compiled once for every parse
+_SCORE_LINE_RE = re.compile(r"^[ \t]*(?:-[ \t]*)?Score:(.*)$", re.MULTILINE)
+_FEEDBACK_LINE_RE = re.compile(r"^[ \t]*(?:-[ \t]*)?Feedback:(.*)$", re.MULTILINE)
+
+# Default providers shared by every judge that isn't given one explicitly, keyed by
+# provider name, so each evaluator doesn't rebuild and re-validate its own provider
+_DEFAULT_PROVIDERS: dict[str, LLMProvider] = {}
+
+
+def _get_default_provider() -> LLMProvider:
+    """Return the shared provider for the configured EVALUATION_PROVIDER."""
+    name = os.getenv("EVALUATION_PROVIDER", "openai")
+    provider = _DEFAULT_PROVIDERS.get(name)
+    if provider is None:
+        provider = _DEFAULT_PROVIDERS[name] = ProviderFactory.create(name)
+    return provider
+
+
+# Verdict for an empty response when output was expected; no LLM call needed
+_EMPTY_RESPONSE_VERDICT = (
+    0.0,
+    "Response is empty; nothing to evaluate against the expected output.",
+)
+
+# Number of (input, response, expected) verdicts each judge remembers
+_VERDICT_CACHE_SIZE = 1024
+
+
+def _verdict_key(*parts: str) -> bytes:
+    """Hash the fields that determine a verdict into a compact cache key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        data = part.encode("utf-8")
+        # Length-prefix each field so ("ab", "c") and ("a", "bc") differ
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.digest()
+
+
+def _load_json_object(text: str) -> dict[str, Any] | None:
+    """Parse the JSON object in a judge reply, or None if there isn't one."""
+    # JSON-mode providers return the bare object; others may wrap it in a code fence
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end < start:
+        return None
+    try:
+        data = loads_json(text[start : end + 1])
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class _JudgeVerdict(BaseModel):
+    """Schema of a JSON-mode judge reply."""
+
+    score: float
+    feedback: str | None = None
+
+
+def _parse_json_verdict(text: str) -> tuple[float, str] | None:
+    """Extract (score, feedback) from a JSON verdict, or None if there isn't one.
+
+    Raises:
+        ValueError: If the reply is a JSON verdict whose fields have the wrong types
+    """
+    data = _load_json_object(text)
+    if data is None or "score" not in data:
+        return None
+    try:
+        verdict = _JudgeVerdict.model_validate(data)
+    except ValidationError as e:
+        raise ValueError(f"LLM judge returned an invalid verdict: {data}") from e
+    return verdict.score, (verdict.feedback or "").strip()
+
+
+def _parse_packed_verdicts(text: str, count: int) -> list[tuple[float, str] | None]:
+    """Split a packed JSON reply into per-item verdicts (None where one is unusable)."""
+    verdicts: list[tuple[float, str] | None] = [None] * count
+    data = _load_json_object(text)
+    entries = data.get("verdicts") if data else None
+    if not isinstance(entries, list):
+        return verdicts
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        item_id = entry.get("id")
+        feedback = str(entry.get("feedback") or "").strip()
+        if not isinstance(item_id, int) or not 1 <= item_id <= count or not feedback:
+            continue
+        score = entry.get("score")
+        if not isinstance(score, int | float):
+            continue
+        verdicts[item_id - 1] = (max(0.0, min(1.0, float(score))), feedback)
+    return verdicts
+
+
+def _format_rubric(rubric: dict[str, Any] | Any) -> str:
+    """Render a weighted rubric as a prompt fragment ("" when there is none)."""
+    if not isinstance(rubric, dict) or not rubric:
+        return ""
+    lines = []
+    for criterion, spec in rubric.items():
+        if isinstance(spec, dict):
+            lines.append(
+                f"- {criterion} (weight: {spec.get('weight', 1.0)}): {spec.get('criteria', '')}"
+            )
+        else:
+            lines.append(f"- {criterion}: {spec}")
+    return "\nRubric criteria:\n" + "\n".join(lines) + "\n"
+
+
+@dataclass(slots=True, frozen=True)
 class JudgeResult:
     """Result from LLM judge evaluation."""
 
@@ -29,15 +186,28 @@ class LLMJudge:
         model: str | None = None,
         judge_url: str | None = None,
         judge_agent: str | None = None,
+        cache_size: int = _VERDICT_CACHE_SIZE,
         **kwargs,
     ):
-        """Initialize with optional provider and configuration."""
-        self.provider = provider or ProviderFactory.create()
+        """Initialize with optional provider and configuration.
+
+        Identical evaluations are answered from an LRU cache of ``cache_size``
+        verdicts (0 disables it), and concurrent duplicates share one LLM call.
+        """
+        self.provider = provider or _get_default_provider()
         self.rubric = rubric or {}
         self.pass_threshold = pass_threshold
         self.model = model
         self.judge_url = judge_url
         self.judge_agent = judge_agent
+        self.cache_size = cache_size
+        # The rubric never changes after construction, so render it into the
+        # static prompt prefix once instead of on every evaluation
+        rubric_text = _format_rubric(self.rubric)
+        self._prompt_prefix = _EVAL_PROMPT_PREFIX + rubric_text
+        self._packed_prompt_prefix = _PACKED_PROMPT_PREFIX + rubric_text
+        self._verdicts: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+        self._inflight: dict[bytes, asyncio.Future] = {}
 
     async def evaluate(
         self,
@@ -56,50 +226,79 @@ class LLMJudge:
         # Use reference if expected not provided
         check_against = reference or expected or ""
 
-        # Build evaluation prompt
-        eval_prompt = f"""
-You are an expert evaluator. Please evaluate the following response based on the expected output.
-
-Input: {input_text}
-Response: {response}
-Expected: {check_against}
+        key = _verdict_key(input_text, str(response), check_against)
+        verdict = self._verdicts.get(key)
+        if verdict is not None:
+            self._verdicts.move_to_end(key)
+        elif check_against and not (response or "").strip():
+            # Nothing to judge: an empty response can't match a non-empty expectation
+            verdict = _EMPTY_RESPONSE_VERDICT
+        else:
+            # Share one in-flight request between concurrent identical evaluations
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = asyncio.ensure_future(
+                    self._request_verdict(input_text, response, check_against)
+                )
+                self._inflight[key] = pending
+                pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+            # Shield so one caller being cancelled doesn't cancel the shared request
+            verdict = await asyncio.shield(pending)
+            self._remember(key, verdict)
+
+        return self._to_result(verdict)
+
+    def _remember(self, key: bytes, verdict: tuple[float, str]) -> None:
+        """Store a verdict in the LRU cache, evicting the oldest past ``cache_size``."""
+        if self.cache_size > 0:
+            self._verdicts[key] = verdict
+            if len(self._verdicts) > self.cache_size:
+                self._verdicts.popitem(last=False)
+
+    def _to_result(self, verdict: tuple[float, str]) -> JudgeResult:
+        """Build a JudgeResult from a (score, feedback) verdict."""
+        score, feedback = verdict
+        passed = score >= self.pass_threshold
 
-Please score the response from 0.0 to 1.0 based on how well it matches the expected output.
-Consider:
-- Factual accuracy
-- Completeness
-- Relevance
+        return JudgeResult(
+            score=score, passed=passed, feedback=feedback, breakdown={"similarity": score}
+        )
 
-Respond with:
-- Score: [0.0-1.0]
-- Feedback: [Brief explanation]
-"""
+    async def _request_verdict(
+        self, input_text: str, response: str, check_against: str
+    ) -> tuple[float, str]:
+        """Ask the LLM for a verdict and parse it into (score, feedback)."""
+        # Build evaluation prompt: the static prefix comes first so every request
+        # shares it, and only the per-case fields vary at the end
+        template = _EVAL_CASE_TEMPLATE if check_against else _EVAL_CASE_TEMPLATE_NO_EXPECTED
+        case_prompt = template.format(input=input_text, response=response, expected=check_against)
 
         try:
-            # Use the LLM provider to evaluate
-            response_obj = await self.provider.complete(eval_prompt)
+            # Use the LLM provider to evaluate, asking for structured JSON output
+            response_obj = await self.provider.complete(
+                case_prompt, cached_prefix=self._prompt_prefix, json_mode=True
+            )
             result = response_obj.content
 
-            # Parse the response - handle different formats
-            lines = result.strip().split("\n")
-            score = None
-            feedback = ""
+            parsed = _parse_json_verdict(result)
+            if parsed is not None:
+                score_value, feedback = parsed
+            else:
+                # Fall back to "Score:" / "- Score:" lines; the last occurrence of
+                # each field wins
+                score_matches = _SCORE_LINE_RE.findall(result)
+                score_value = score_matches[-1].strip() if score_matches else None
+                feedback_matches = _FEEDBACK_LINE_RE.findall(result)
+                feedback = feedback_matches[-1].strip() if feedback_matches else ""
 
-            for line in lines:
-                line = line.strip()
-                # Handle different score formats
-                if line.startswith("Score:") or line.startswith("- Score:"):
-                    try:
-                        score_text = line.split(":")[-1].strip()
-                        score = float(score_text)
-                        # Ensure score is within valid range
-                        score = max(0.0, min(1.0, score))
-                    except (ValueError, TypeError):
-                        # If we can't parse the score, this is a critical error
-                        raise ValueError(f"LLM judge returned invalid score format: {line}")
-                # Handle different feedback formats
-                elif line.startswith("Feedback:") or line.startswith("- Feedback:"):
-                    feedback = line.split(":", 1)[-1].strip()
+            score = None
+            if score_value is not None:
+                try:
+                    # Ensure score is within valid range
+                    score = max(0.0, min(1.0, float(score_value)))
+                except (ValueError, TypeError):
+                    # If we can't parse the score, this is a critical error
+                    raise ValueError(f"LLM judge returned invalid score format: {score_value}")
 
             # If we couldn't parse score or feedback, this is a critical error
             if score is None or not feedback:
@@ -111,12 +310,168 @@ Respond with:
             # NO FALLBACKS - if LLM evaluation fails, we must fail
             raise RuntimeError(f"LLM evaluation failed and no fallbacks allowed: {str(e)}")
 
-        passed = score >= self.pass_threshold
+        return score, feedback
 
-        return JudgeResult(
-            score=score, passed=passed, feedback=feedback, breakdown={"similarity": score}
+    async def batch_evaluate(
+        self, evaluations: list[dict[str, Any]], max_concurrent: int = 5
+    ) -> list[JudgeResult]:
+        """
+        Evaluate many responses concurrently.
+
+        Every evaluation is started at once and gated by a semaphore, so a new
+        judge call begins as soon as any in-flight call finishes.
+
+        Args:
+            evaluations: Keyword arguments for ``evaluate``, one dict per case
+            max_concurrent: Maximum number of judge calls in flight
+
+        Returns:
+            JudgeResults in the same order as ``evaluations``
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def _evaluate_one(evaluation: dict[str, Any]) -> JudgeResult:
+            async with semaphore:
+                return await self.evaluate(**evaluation)
+
+        return list(await asyncio.gather(*(_evaluate_one(e) for e in evaluations)))
+
+    async def batch_evaluate_streaming(
+        self,
+        evaluations: list[dict[str, Any]],
+        max_concurrent: int = 5,
+        stop_when: Callable[[JudgeResult], bool] | None = None,
+    ) -> AsyncIterator[tuple[int, JudgeResult]]:
+        """
+        Evaluate many responses concurrently, yielding results as they finish.
+
+        Lets callers aggregate progressively or stop early. When the caller stops
+        iterating, or once ``stop_when`` accepts a result, evaluations still
+        waiting for a slot are cancelled; judge calls already in flight (at most
+        ``max_concurrent``) are shared with any identical ``evaluate`` calls, so
+        they run to completion and are billed.
+
+        Args:
+            evaluations: Keyword arguments for ``evaluate``, one dict per case
+            max_concurrent: Maximum number of judge calls in flight
+            stop_when: Predicate checked on each result; the stream ends after
+                yielding the first result it returns True for
+
+        Yields:
+            (index into ``evaluations``, JudgeResult) in completion order
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def _evaluate_one(index: int, evaluation: dict[str, Any]):
+            async with semaphore:
+                return index, await self.evaluate(**evaluation)
+
+        tasks = [asyncio.ensure_future(_evaluate_one(i, e)) for i, e in enumerate(evaluations)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
+                yield index, result
+                if stop_when is not None and stop_when(result):
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def batch_evaluate_packed(
+        self, evaluations: list[dict[str, Any]], pack_size: int = 5, max_concurrent: int = 5
+    ) -> list[JudgeResult]:
+        """
+        Evaluate many responses, judging up to ``pack_size`` of them per LLM call.
+
+        Packing amortizes request overhead for short cases. Cached, empty and
+        duplicate cases are resolved without being packed, and any case the
+        packed reply doesn't give a usable verdict for is judged on its own.
+
+        Args:
+            evaluations: Keyword arguments for ``evaluate``, one dict per case
+            pack_size: Maximum number of cases per LLM call
+            max_concurrent: Maximum number of LLM calls in flight
+
+        Returns:
+            JudgeResults in the same order as ``evaluations``
+        """
+        verdicts: list[tuple[float, str] | None] = [None] * len(evaluations)
+        # Uncached cases by verdict key: (input, response, expected) and their indices
+        pending: dict[bytes, tuple[tuple[str, str, str], list[int]]] = {}
+
+        for i, evaluation in enumerate(evaluations):
+            input_text = evaluation.get("task") or evaluation.get("prompt") or ""
+            response = evaluation.get("response")
+            check_against = evaluation.get("reference") or evaluation.get("expected") or ""
+
+            key = _verdict_key(input_text, str(response), check_against)
+            verdict = self._verdicts.get(key)
+            if verdict is not None:
+                self._verdicts.move_to_end(key)
+                verdicts[i] = verdict
+            elif check_against and not (response or "").strip():
+                verdicts[i] = _EMPTY_RESPONSE_VERDICT
+            elif key in pending:
+                pending[key][1].append(i)
+            else:
+                pending[key] = ((input_text, str(response), check_against), [i])
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def _judge_one(key: bytes, case: tuple[str, str, str]) -> tuple[float, str]:
+            async with semaphore:
+                return await self._request_verdict(*case)
+
+        async def _judge_pack(keys: list[bytes]) -> None:
+            cases = [pending[key][0] for key in keys]
+            async with semaphore:
+                packed = await self._request_packed_verdicts(cases)
+            # Judge anything the packed reply left out individually
+            retried = await asyncio.gather(
+                *(_judge_one(key, case) for key, case, v in zip(keys, cases, packed) if v is None)
+            )
+            fallback = iter(retried)
+            for key, verdict in zip(keys, packed):
+                if verdict is None:
+                    verdict = next(fallback)
+                self._remember(key, verdict)
+                for i in pending[key][1]:
+                    verdicts[i] = verdict
+
+        keys = list(pending)
+        await asyncio.gather(
+            *(_judge_pack(keys[i : i + pack_size]) for i in range(0, len(keys), pack_size))
+        )
+
+        results = []
+        for verdict in verdicts:
+            # Every case was resolved above: from the cache, as empty, or by its pack
+            assert verdict is not None
+            results.append(self._to_result(verdict))
+        return results
+
+    async def _request_packed_verdicts(
+        self, cases: list[tuple[str, str, str]]
+    ) -> list[tuple[float, str] | None]:
+        """Ask the LLM to judge several (input, response, expected) cases at once."""
+        items = "".join(
+            f"\n[{n}]\nInput: {input_text}\nResponse: {response}\nExpected: {check_against}\n"
+            for n, (input_text, response, check_against) in enumerate(cases, 1)
         )
 
+        try:
+            response_obj = await self.provider.complete(
+                items,
+                cached_prefix=self._packed_prompt_prefix,
+                max_tokens=max(1000, _PACKED_TOKENS_PER_ITEM * len(cases)),
+                json_mode=True,
+            )
+        except Exception as e:
+            # NO FALLBACKS - if LLM evaluation fails, we must fail
+            raise RuntimeError(f"LLM evaluation failed and no fallbacks allowed: {str(e)}")
+
+        return _parse_packed_verdicts(response_obj.content, len(cases))
+
     async def compare(
         self, prompt: str, response1: str, response2: str, criteria: str | None = None
     ) -> dict[str, Any]:
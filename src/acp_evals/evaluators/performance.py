@@ -24,6 +24,14 @@ try:
 except ImportError:
     HAS_DISPLAY = False
 
+# Latency feedback tiers as (upper bound in ms, message), checked in order
+_LATENCY_FEEDBACK = (
+    (200.0, "Excellent response time (<200ms)"),
+    (500.0, "Good response time (<500ms)"),
+    (1000.0, "Acceptable response time (<1s)"),
+)
+_SLOW_LATENCY_FEEDBACK = "Response time needs improvement (>1s)"
+
 
 @dataclass
 class PerformanceMetrics:
@@ -234,14 +242,12 @@ class PerformanceEval(BaseEval):
 
         # Latency feedback
         mean_latency = latency_stats["mean_ms"]
-        if mean_latency < 200:
-            feedback.append("Excellent response time (<200ms)")
-        elif mean_latency < 500:
-            feedback.append("Good response time (<500ms)")
-        elif mean_latency < 1000:
-            feedback.append("Acceptable response time (<1s)")
-        else:
-            feedback.append("Response time needs improvement (>1s)")
+        feedback.append(
+            next(
+                (message for limit, message in _LATENCY_FEEDBACK if mean_latency < limit),
+                _SLOW_LATENCY_FEEDBACK,
+            )
+        )
 
         # Consistency feedback
         if latency_stats["std_dev_ms"] > mean_latency * 0.5:
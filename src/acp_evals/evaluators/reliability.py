@@ -8,12 +8,27 @@ including tool usage tracking, error handling, and retry behavior.
 import asyncio
 import time
 from collections.abc import Callable
+from itertools import pairwise
 from typing import Any
 
-from acp_sdk.models import Message, MessagePart
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .common import BaseEval, EvalResult, console
+from .common import (
+    BaseEval,
+    EvalResult,
+    _agent_semaphore,
+    _extract_response_text,
+    _text_message,
+    console,
+)
+
+# Inputs sent to probe error handling; built once rather than on every run
+_ERROR_HANDLING_PROBES = (
+    "",  # Empty input
+    "a" * 10000,  # Very long input
+    "Please divide by zero: 1/0",  # Mathematical error
+    "Access undefined variable: {{undefined_var}}",  # Template error
+)
 
 
 class ReliabilityEval(BaseEval):
@@ -53,6 +68,7 @@ class ReliabilityEval(BaseEval):
         test_error_handling: bool = False,
         test_retry: bool = False,
         print_results: bool = False,
+        _disable_progress: bool = False,
     ) -> EvalResult:
         """
         Run reliability evaluation.
@@ -71,6 +87,7 @@ class ReliabilityEval(BaseEval):
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            disable=_disable_progress,
         ) as progress:
             task = progress.add_task("Testing reliability...", total=None)
 
@@ -83,53 +100,44 @@ class ReliabilityEval(BaseEval):
                 if not client:
                     raise ValueError("Failed to create ACP client")
 
-                agent_name = self.agent.split("/agents/")[-1]
-
-                message = Message(parts=[MessagePart(content=input, content_type="text/plain")])
-
-                try:
-                    # Start run
-                    run = await client.run_async(agent=agent_name, input=[message])
-
-                    # Collect events in parallel with run
-                    event_collection_task = asyncio.create_task(
-                        self._collect_events(client, str(run.run_id), events_collected)
-                    )
+                agent_name = self._agent_name
 
-                    # Wait for completion
-                    while run.status not in ["completed", "failed", "cancelled"]:
-                        await asyncio.sleep(0.1)
-                        run = await client.run_status(run_id=str(run.run_id))
+                message = _text_message(input)
 
-                    # Stop event collection
-                    event_collection_task.cancel()
+                async with _agent_semaphore(self.agent):
                     try:
-                        await event_collection_task
-                    except asyncio.CancelledError:
-                        pass
-
-                    # Extract response
-                    response_text = ""
-                    if run.output:
-                        for msg in run.output:
-                            for part in msg.parts:
-                                if part.content:
-                                    response_text += part.content + "\n"
-
-                    agent_result = {
-                        "response": response_text.strip(),
-                        "run_id": str(run.run_id),
-                        "status": run.status,
-                        "events": events_collected,
-                    }
+                        # Start run
+                        run = await client.run_async(agent=agent_name, input=[message])
 
-                except Exception as e:
-                    agent_result = {
-                        "response": "",
-                        "status": "failed",
-                        "error": str(e),
-                        "events": events_collected,
-                    }
+                        # Collect events in parallel with run
+                        event_collection_task = asyncio.create_task(
+                            self._collect_events(client, str(run.run_id), events_collected)
+                        )
+
+                        # Wait for completion
+                        run = await self._wait_for_run(client, run)
+
+                        # Stop event collection
+                        event_collection_task.cancel()
+                        try:
+                            await event_collection_task
+                        except asyncio.CancelledError:
+                            pass
+
+                        agent_result = {
+                            "response": _extract_response_text(run),
+                            "run_id": str(run.run_id),
+                            "status": run.status,
+                            "events": events_collected,
+                        }
+
+                    except Exception as e:
+                        agent_result = {
+                            "response": "",
+                            "status": "failed",
+                            "error": str(e),
+                            "events": events_collected,
+                        }
             else:
                 # Non-ACP agent - run normally
                 agent_result = await self._run_agent(input)
@@ -274,24 +282,22 @@ class ReliabilityEval(BaseEval):
     async def _test_error_handling(self, original_input: str) -> dict[str, Any]:
         """Test agent's error handling capabilities."""
         # Test with invalid input
-        test_inputs = [
-            "",  # Empty input
-            "a" * 10000,  # Very long input
-            "Please divide by zero: 1/0",  # Mathematical error
-            "Access undefined variable: {{undefined_var}}",  # Template error
-        ]
-
-        errors_handled = 0
+        test_inputs = _ERROR_HANDLING_PROBES
         total_tests = len(test_inputs)
 
-        for test_input in test_inputs:
-            try:
-                result = await self._run_agent(test_input)
-                if result.get("response") and "error" not in result.get("response", "").lower():
-                    errors_handled += 1
-            except Exception:
-                # Agent crashed - not handled well
-                pass
+        # Probes are independent, so send them to the agent concurrently
+        results = await asyncio.gather(
+            *(self._run_agent(test_input) for test_input in test_inputs),
+            return_exceptions=True,
+        )
+
+        errors_handled = 0
+        for result in results:
+            # An exception means the agent crashed - not handled well
+            if isinstance(result, BaseException):
+                continue
+            if result.get("response") and "error" not in result.get("response", "").lower():
+                errors_handled += 1
 
         return {
             "passed": errors_handled == total_tests,
@@ -330,7 +336,7 @@ class ReliabilityEval(BaseEval):
         has_backoff = False
         if len(attempts) > 1:
             latencies = [a["latency"] for a in attempts]
-            has_backoff = all(latencies[i] < latencies[i + 1] for i in range(len(latencies) - 1))
+            has_backoff = all(earlier < later for earlier, later in pairwise(latencies))
 
         return {
             "passed": any(a["success"] for a in attempts),
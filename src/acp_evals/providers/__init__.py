@@ -1,7 +1,7 @@
 """LLM providers for evaluation."""
 
 from .anthropic_provider import AnthropicProvider
-from .base import LLMProvider, LLMResponse
+from .base import LLMProvider, LLMResponse, close_shared_http_client
 from .factory import ProviderFactory
 from .ollama_provider import OllamaProvider
 from .openai_provider import OpenAIProvider
@@ -13,4 +13,5 @@ __all__ = [
     "OpenAIProvider",
     "AnthropicProvider",
     "OllamaProvider",
+    "close_shared_http_client",
 ]
@@ -3,6 +3,11 @@
 import logging
 import os
 
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
 from ..core.exceptions import (
     ProviderAPIError,
     ProviderConnectionError,
@@ -10,23 +15,66 @@ from ..core.exceptions import (
     ProviderRateLimitError,
     format_provider_setup_help,
 )
-from .base import LLMProvider, LLMResponse
+from .base import (
+    _SDK_MAX_RETRIES,
+    _SDK_TIMEOUT,
+    _SYSTEM_PROMPT,
+    LLMProvider,
+    LLMResponse,
+    _shared_http_client,
+)
 
 logger = logging.getLogger(__name__)
 
+# System prompt sent as a cacheable block so repeated calls reuse it
+_SYSTEM_BLOCK = {
+    "type": "text",
+    "text": _SYSTEM_PROMPT,
+    "cache_control": {"type": "ephemeral"},
+}
+
 
 class AnthropicProvider(LLMProvider):
     """Anthropic API provider."""
 
-    # Pricing per 1K tokens (as of June 2025)
+    _NATIVE_PREFIX_CACHING = True
+    _USES_SHARED_HTTP = True
+
+    # Pricing per 1K tokens (as of June 2025); prompt-cache writes bill at 1.25x
+    # input and cache reads at 0.1x input
     PRICING = {
         # June 2025 Models - Claude 4 series
-        "claude-opus-4": {"input": 0.015, "output": 0.075},  # 32K output
-        "claude-sonnet-4": {"input": 0.003, "output": 0.015},  # 64K output, SWE-bench 72.7%
+        "claude-opus-4": {
+            "input": 0.015,
+            "output": 0.075,
+            "cache_write": 0.01875,
+            "cache_read": 0.0015,
+        },  # 32K output
+        "claude-sonnet-4": {
+            "input": 0.003,
+            "output": 0.015,
+            "cache_write": 0.00375,
+            "cache_read": 0.0003,
+        },  # 64K output, SWE-bench 72.7%
         # Legacy models (still supported)
-        "claude-3-opus": {"input": 0.015, "output": 0.075},
-        "claude-3-sonnet": {"input": 0.003, "output": 0.015},
-        "claude-3-haiku": {"input": 0.00025, "output": 0.00125},
+        "claude-3-opus": {
+            "input": 0.015,
+            "output": 0.075,
+            "cache_write": 0.01875,
+            "cache_read": 0.0015,
+        },
+        "claude-3-sonnet": {
+            "input": 0.003,
+            "output": 0.015,
+            "cache_write": 0.00375,
+            "cache_read": 0.0003,
+        },
+        "claude-3-haiku": {
+            "input": 0.00025,
+            "output": 0.00125,
+            "cache_write": 0.0003,
+            "cache_read": 0.00003,
+        },
     }
 
     # Model mapping to actual API names
@@ -54,6 +102,11 @@ class AnthropicProvider(LLMProvider):
         # Initialize parent class (will call validate_config)
         super().__init__(model, api_key, **kwargs)
 
+        # Resolve the pricing entry once instead of scanning PRICING on every call
+        self._pricing = next(
+            (pricing for key, pricing in self.PRICING.items() if key in self.model), None
+        )
+
         # Import Anthropic library
         self._import_anthropic()
 
@@ -61,21 +114,49 @@ class AnthropicProvider(LLMProvider):
     def name(self) -> str:
         return "anthropic"
 
-    async def complete(
-        self, prompt: str, temperature: float = 0.0, max_tokens: int = 1000, **kwargs
+    def _create_client(self):
+        return self.anthropic.AsyncAnthropic(
+            api_key=self.api_key,
+            max_retries=_SDK_MAX_RETRIES,
+            timeout=_SDK_TIMEOUT,
+            http_client=_shared_http_client(),
+        )
+
+    async def _complete_uncached(
+        self,
+        prompt: str,
+        temperature: float = 0.0,
+        max_tokens: int = 1000,
+        cached_prefix: str | None = None,
+        **kwargs,
     ) -> LLMResponse:
-        """Get completion from Anthropic."""
+        """
+        Get completion from Anthropic.
+
+        The system prompt, plus ``cached_prefix`` when given (e.g. a long shared
+        rubric), is sent as prompt-cached blocks so later calls within the cache
+        lifetime bill those tokens at the cache-read rate.
+        """
         try:
-            # Configure client
-            client = self.anthropic.AsyncAnthropic(api_key=self.api_key)
+            # Reuse one client so calls share keep-alive connections
+            client = self._get_client()
 
             # Get actual model name from mapping
             actual_model = self.MODEL_MAPPING.get(self.model, self.model)
 
+            # The Messages API has no JSON output mode; the prompt asks for JSON instead
+            kwargs.pop("json_mode", None)
+
             # Make request
+            system = [_SYSTEM_BLOCK]
+            if cached_prefix:
+                system.append(
+                    {"type": "text", "text": cached_prefix, "cache_control": {"type": "ephemeral"}}
+                )
+
             response = await client.messages.create(
                 model=actual_model,
-                system="You are an expert evaluator.",
+                system=system,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=temperature,
                 max_tokens=max_tokens,
@@ -84,10 +165,18 @@ class AnthropicProvider(LLMProvider):
 
             # Extract response
             content = response.content[0].text
+            # input_tokens excludes tokens written to or read from the prompt cache
+            cache_write = getattr(response.usage, "cache_creation_input_tokens", None) or 0
+            cache_read = getattr(response.usage, "cache_read_input_tokens", None) or 0
             usage = {
                 "prompt_tokens": response.usage.input_tokens,
                 "completion_tokens": response.usage.output_tokens,
-                "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
+                "cache_creation_input_tokens": cache_write,
+                "cache_read_input_tokens": cache_read,
+                "total_tokens": response.usage.input_tokens
+                + response.usage.output_tokens
+                + cache_write
+                + cache_read,
             }
 
             # Calculate cost
@@ -103,15 +192,15 @@ class AnthropicProvider(LLMProvider):
             retry_after = getattr(e.response.headers, "retry-after", None)
             raise ProviderRateLimitError("anthropic", retry_after) from e
 
+        except self.anthropic.APIConnectionError as e:
+            logger.error(f"Anthropic connection error: {str(e)}")
+            raise ProviderConnectionError("anthropic", e) from e
+
         except self.anthropic.APIError as e:
             logger.error(f"Anthropic API error: {str(e)}")
             status_code = getattr(e, "status_code", None)
             raise ProviderAPIError("anthropic", status_code, str(e)) from e
 
-        except self.anthropic.APIConnectionError as e:
-            logger.error(f"Anthropic connection error: {str(e)}")
-            raise ProviderConnectionError("anthropic", e) from e
-
         except Exception as e:
             logger.error(f"Unexpected Anthropic error: {str(e)}")
             # Re-raise with more context
@@ -119,20 +208,16 @@ class AnthropicProvider(LLMProvider):
 
     def calculate_cost(self, usage: dict[str, int]) -> float:
         """Calculate cost based on Anthropic pricing."""
-        model_key = None
-        for key in self.PRICING:
-            if key in self.model:
-                model_key = key
-                break
-
-        if not model_key:
+        pricing = self._pricing
+        if pricing is None:
             return 0.0
 
-        pricing = self.PRICING[model_key]
-        input_cost = (usage.get("prompt_tokens", 0) / 1000) * pricing["input"]
-        output_cost = (usage.get("completion_tokens", 0) / 1000) * pricing["output"]
-
-        return input_cost + output_cost
+        return (
+            usage.get("prompt_tokens", 0) * pricing["input"]
+            + usage.get("completion_tokens", 0) * pricing["output"]
+            + usage.get("cache_creation_input_tokens", 0) * pricing["cache_write"]
+            + usage.get("cache_read_input_tokens", 0) * pricing["cache_read"]
+        ) / 1000
 
     def validate_config(self) -> None:
         """Validate Anthropic configuration."""
@@ -159,16 +244,13 @@ class AnthropicProvider(LLMProvider):
             )
 
     def _import_anthropic(self) -> None:
-        """Import Anthropic library with helpful error message."""
-        try:
-            import anthropic
-
-            self.anthropic = anthropic
-        except ImportError:
+        """Bind the Anthropic library, with a helpful error if it isn't installed."""
+        if anthropic is None:
             raise ImportError(
                 "Anthropic provider requires 'anthropic' package.\n"
                 "Install with: pip install 'acp-evals[anthropic]' or pip install anthropic"
             )
+        self.anthropic = anthropic
 
     @classmethod
     def get_required_env_vars(cls) -> list[str]:
@@ -1,10 +1,77 @@
 """Base LLM provider interface."""
 
+import asyncio
+import hashlib
+import importlib.util
 import os
+import string
+import time
+import weakref
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
 from typing import Any
 
+import httpx
+
+# System prompt every provider sends ahead of the judge prompt
+_SYSTEM_PROMPT = "You are an expert evaluator."
+
+# Connection pool sizing for provider HTTP clients, enough for bursts of
+# concurrent judge calls without queueing at the connection layer
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+# httpx only speaks HTTP/2 with the optional h2 package installed
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# SDK clients retry transient failures (429s, 5xx, connection errors) with
+# exponential backoff before an error reaches the caller
+_SDK_MAX_RETRIES = 5
+_SDK_TIMEOUT = 60.0
+
+# HTTP client shared by the SDK-backed providers, so judges on different providers
+# and models reuse warm connections. httpx pools are bound to the event loop they
+# were created on, so one client is kept per loop.
+_SHARED_HTTP_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Number of completions each provider keeps in its response cache
+_RESPONSE_CACHE_SIZE = 1024
+
+# Default number of concurrent requests in complete_many (EVALUATION_MAX_CONCURRENCY
+# overrides)
+_DEFAULT_MAX_CONCURRENCY = 16
+
+# Default lifetime of a cached completion in seconds (EVALUATION_CACHE_TTL overrides)
+_DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+# Recent prompts compared for near-duplicate matches when fuzzy caching is enabled
+_FUZZY_CACHE_SIZE = 256
+_STRIP_PUNCTUATION = str.maketrans("", "", string.punctuation)
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """Return the running loop's shared provider HTTP client, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    client = _SHARED_HTTP_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(http2=_HTTP2, limits=_HTTP_LIMITS)
+        _SHARED_HTTP_CLIENTS[loop] = client
+    return client
+
+
+async def close_shared_http_client() -> None:
+    """Close the running loop's shared provider HTTP client, if one was created."""
+    client = _SHARED_HTTP_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _prompt_words(prompt: str) -> frozenset[str]:
+    """Canonical word set of a prompt: case, punctuation and spacing ignored."""
+    return frozenset(prompt.lower().translate(_STRIP_PUNCTUATION).split())
+
 
 @dataclass
 class LLMResponse:
@@ -15,11 +82,27 @@ class LLMResponse:
     usage: dict[str, int] | None = None
     cost: float | None = None
     raw_response: Any | None = None
+    # "exact" or "fuzzy" when served from the response cache
+    cache_kind: str | None = None
+
+
+def _copy_response(response: LLMResponse, **changes: Any) -> LLMResponse:
+    """Copy a response along with its usage dict, which callers may mutate."""
+    usage = dict(response.usage) if response.usage is not None else None
+    return replace(response, usage=usage, **changes)
 
 
 class LLMProvider(ABC):
     """Base class for LLM providers."""
 
+    # Whether _complete_uncached takes ``cached_prefix`` and caches it server-side;
+    # other providers get the prefix inlined at the top of the prompt
+    _NATIVE_PREFIX_CACHING = False
+
+    # Whether the API client sends requests through _shared_http_client(); those
+    # clients are only dropped on close(), since the pool outlives any one provider
+    _USES_SHARED_HTTP = False
+
     def __init__(self, model: str, api_key: str | None = None, **kwargs):
         """
         Initialize provider.
@@ -27,39 +110,239 @@ class LLMProvider(ABC):
         Args:
             model: Model name to use
             api_key: API key (can be None if using env vars)
-            **kwargs: Provider-specific configuration
+            **kwargs: Provider-specific configuration; ``response_cache=True``
+                answers repeated deterministic requests from an in-memory cache,
+                and ``fuzzy_cache_threshold`` (e.g. 0.85) then also serves cached completions for prompts whose word
+                sets have at least that Jaccard similarity to a recent prompt.
+                Requests with ``json_mode`` (e.g. judge verdicts) never match
+                fuzzily, since their prompts can differ in only a few words.
         """
         self.model = model
         self.api_key = api_key
         self.config = kwargs
 
+        # API client reused across calls; see _get_client
+        self._client: Any | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+        # Response cache: key -> (stored at, response), oldest first
+        self._cache_enabled = bool(kwargs.get("response_cache", False))
+        self._responses: OrderedDict[str, tuple[float, LLMResponse]] = OrderedDict()
+        self._cache_ttl = float(os.getenv("EVALUATION_CACHE_TTL", _DEFAULT_CACHE_TTL))
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        # Opt-in near-duplicate matching over recent prompts:
+        # (options key, word set, stored at, response)
+        self._fuzzy_threshold: float | None = kwargs.get("fuzzy_cache_threshold")
+        self._fuzzy_entries: deque[tuple[str, frozenset[str], float, LLMResponse]] = deque(
+            maxlen=_FUZZY_CACHE_SIZE
+        )
+        self._cache_fuzzy_hits = 0
+
         # Validate configuration on initialization
         self.validate_config()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Providers written before _complete_uncached existed implement complete
+        # directly; they keep working, without the response cache
+        if "complete" in cls.__dict__ and getattr(
+            cls._complete_uncached, "__isabstractmethod__", False
+        ):
+            cls._complete_uncached = cls.__dict__["complete"]
+
     @property
     @abstractmethod
     def name(self) -> str:
         """Provider name."""
         pass
 
-    @abstractmethod
     async def complete(
         self, prompt: str, temperature: float = 0.0, max_tokens: int = 1000, **kwargs
     ) -> LLMResponse:
         """
         Get completion from LLM.
 
+        On providers created with ``response_cache=True``, deterministic requests
+        (``temperature == 0.0``) are answered from an in-memory LRU cache when the
+        same request was made within the cache TTL; pass ``cache=True`` or
+        ``cache=False`` to override per request. Cache hits are copies, so callers
+        may modify the returned response.
+
         Args:
             prompt: The prompt to complete
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
-            **kwargs: Provider-specific parameters
+            **kwargs: Provider-specific parameters; ``json_mode=True`` asks providers
+                with a structured-output mode to return a single JSON object, and
+                ``cached_prefix`` is a static prompt prefix (e.g. a long rubric)
+                that providers with prompt caching bill at the cache-read rate
 
         Returns:
             LLMResponse with completion
         """
+        if not self._NATIVE_PREFIX_CACHING:
+            # Leading the prompt verbatim still lets automatic prefix caching apply
+            cached_prefix = kwargs.pop("cached_prefix", None)
+            if cached_prefix:
+                prompt = cached_prefix + prompt
+
+        use_cache = kwargs.pop("cache", self._cache_enabled and temperature == 0.0)
+        if not use_cache:
+            return await self._complete_uncached(prompt, temperature, max_tokens, **kwargs)
+
+        key = self._cache_key(prompt, temperature, max_tokens, kwargs)
+        entry = self._responses.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < self._cache_ttl:
+            self._responses.move_to_end(key)
+            self._cache_hits += 1
+            return _copy_response(entry[1], cache_kind="exact")
+
+        words = None
+        threshold = self._fuzzy_threshold
+        # Structured (json_mode) requests such as judge verdicts can differ only in a
+        # short span, like the response under review, so they only match exactly
+        if threshold is not None and not kwargs.get("json_mode"):
+            options = self._cache_key("", temperature, max_tokens, kwargs)
+            words = _prompt_words(prompt)
+            match = self._fuzzy_lookup(options, words, now, threshold)
+            if match is not None:
+                self._cache_fuzzy_hits += 1
+                return _copy_response(match, cache_kind="fuzzy")
+
+        self._cache_misses += 1
+        response = await self._complete_uncached(prompt, temperature, max_tokens, **kwargs)
+        # Cache a copy so the caller's changes to its response can't leak into hits
+        cached = _copy_response(response)
+        self._responses[key] = (now, cached)
+        self._responses.move_to_end(key)
+        if len(self._responses) > _RESPONSE_CACHE_SIZE:
+            self._responses.popitem(last=False)
+        if words is not None:
+            self._fuzzy_entries.append((options, words, now, cached))
+        return response
+
+    def _fuzzy_lookup(
+        self, options: str, words: frozenset[str], now: float, threshold: float
+    ) -> LLMResponse | None:
+        """Find a recent response to a near-duplicate prompt with the same options."""
+        size = len(words)
+        for entry_options, entry_words, stored_at, response in reversed(self._fuzzy_entries):
+            if entry_options != options or now - stored_at >= self._cache_ttl:
+                continue
+            # Jaccard similarity can't exceed the ratio of the set sizes
+            other = len(entry_words)
+            if min(size, other) < threshold * max(size, other):
+                continue
+            union = len(words | entry_words)
+            if union and len(words & entry_words) >= threshold * union:
+                return response
+        return None
+
+    async def complete_many(
+        self, prompts: list[str], *, concurrency: int | None = None, **kwargs
+    ) -> list[LLMResponse | BaseException]:
+        """
+        Complete many prompts concurrently.
+
+        Requests overlap their round-trips, with at most ``concurrency`` in flight.
+
+        Args:
+            prompts: Prompts to complete
+            concurrency: Maximum requests in flight (defaults to the
+                EVALUATION_MAX_CONCURRENCY env var, or 16)
+            **kwargs: Passed to ``complete`` for every prompt
+
+        Returns:
+            One entry per prompt, in order: the LLMResponse, or the exception its
+            request raised
+        """
+        if concurrency is None:
+            concurrency = int(os.getenv("EVALUATION_MAX_CONCURRENCY", _DEFAULT_MAX_CONCURRENCY))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _complete_one(prompt: str) -> LLMResponse:
+            async with semaphore:
+                return await self.complete(prompt, **kwargs)
+
+        return await asyncio.gather(
+            *(_complete_one(prompt) for prompt in prompts), return_exceptions=True
+        )
+
+    @abstractmethod
+    async def _complete_uncached(
+        self, prompt: str, temperature: float = 0.0, max_tokens: int = 1000, **kwargs
+    ) -> LLMResponse:
+        """
+        Request a completion from the provider's API, bypassing the cache.
+
+        Subclasses implement this rather than ``complete``. Subclasses that
+        still override ``complete`` itself work unchanged, but bypass the cache.
+        """
         pass
 
+    def _cache_key(
+        self, prompt: str, temperature: float, max_tokens: int, kwargs: dict[str, Any]
+    ) -> str:
+        """Hash everything that determines a completion into a cache key."""
+        options = repr(sorted(kwargs.items()))
+        request = f"{self.name}:{self.model}:{temperature}:{max_tokens}:{options}:{prompt}"
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def cache_stats(self) -> dict[str, int]:
+        """
+        Get response cache statistics.
+
+        Returns:
+            Dict with cache ``hits``, near-duplicate ``fuzzy_hits``, ``misses``
+            and current ``size``
+        """
+        return {
+            "hits": self._cache_hits,
+            "fuzzy_hits": self._cache_fuzzy_hits,
+            "misses": self._cache_misses,
+            "size": len(self._responses),
+        }
+
+    def _create_client(self) -> Any:
+        """
+        Create the API client used by ``complete``.
+
+        Override in subclasses that talk to their API through a reusable client.
+        """
+        raise NotImplementedError
+
+    def _get_client(self) -> Any:
+        """
+        Return the shared API client, creating it on first use.
+
+        Clients keep an httpx connection pool that is bound to the event loop it
+        was created on, so a provider used from a new loop (e.g. a later
+        ``asyncio.run``) gets a fresh client instead of a dead pool.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = self._create_client()
+            self._client_loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        """
+        Close the API client and its connections, if one was created.
+
+        Providers on the shared HTTP client only release their API client; use
+        ``close_shared_http_client`` to close the shared connections.
+        """
+        client = self._client
+        self._client = None
+        self._client_loop = None
+        if client is not None and not self._USES_SHARED_HTTP:
+            # httpx clients close with aclose(); the OpenAI/Anthropic SDKs with close()
+            close = getattr(client, "aclose", None) or client.close
+            await close()
+
     def calculate_cost(self, usage: dict[str, int]) -> float:
         """
         Calculate cost based on usage.
@@ -68,6 +351,33 @@ class LLMProvider(ABC):
         """
         return 0.0
 
+    def bulk_cost(self, usages: list[dict[str, int]]) -> float:
+        """
+        Calculate the total cost of many completions.
+
+        Pricing is linear in token counts, so each token column is summed with
+        NumPy and priced once instead of calling ``calculate_cost`` per response.
+
+        Args:
+            usages: Usage dicts, as found on ``LLMResponse.usage``
+
+        Returns:
+            Total cost
+        """
+        if not usages:
+            return 0.0
+
+        # Deferred so importing a provider doesn't pay for NumPy
+        import numpy as np
+
+        count = len(usages)
+        keys = {key for usage in usages for key in usage}
+        totals = {}
+        for key in keys:
+            column = (usage.get(key, 0) for usage in usages)
+            totals[key] = int(np.fromiter(column, dtype=np.int64, count=count).sum())
+        return self.calculate_cost(totals)
+
     def validate_config(self) -> None:
         """
         Validate provider configuration.
@@ -18,6 +18,13 @@ class ProviderFactory:
         "ollama": OllamaProvider,
     }
 
+    # Detection results, computed from the environment once per process; see
+    # clear_detection_cache
+    _detected: dict[str, bool] | None = None
+    _default_provider: str | None = None
+    # Whether _default_provider is filled in (None is a valid result)
+    _default_resolved = False
+
     @classmethod
     def create(cls, provider: str | None = None, **kwargs) -> LLMProvider:
         """
@@ -58,9 +65,15 @@ class ProviderFactory:
         """
         Detect which providers have valid configuration.
 
+        The result is cached; call ``clear_detection_cache`` after changing the
+        environment.
+
         Returns:
             Dict mapping provider names to availability
         """
+        if cls._detected is not None:
+            return dict(cls._detected)
+
         available = {}
 
         # Check OpenAI
@@ -72,19 +85,32 @@ class ProviderFactory:
         # Check Ollama (always available if running)
         available["ollama"] = True  # Will fail on connection if not running
 
-        return available
+        cls._detected = available
+        return dict(available)
 
     @classmethod
     def get_default_provider(cls) -> str | None:
         """
         Get the default provider based on available configuration.
 
+        The result is cached; call ``clear_detection_cache`` after changing the
+        environment.
+
         Returns:
             Provider name or None if no providers configured
         """
+        if not cls._default_resolved:
+            cls._default_provider = cls._resolve_default_provider()
+            cls._default_resolved = True
+        return cls._default_provider
+
+    @classmethod
+    def _resolve_default_provider(cls) -> str | None:
+        """Pick the default provider from the current environment."""
         # Check explicit setting first
-        if os.getenv("EVALUATION_PROVIDER"):
-            return os.getenv("EVALUATION_PROVIDER")
+        explicit = os.getenv("EVALUATION_PROVIDER")
+        if explicit:
+            return explicit
 
         # Auto-detect based on available API keys
         available = cls.detect_available_providers()
@@ -98,6 +124,13 @@ class ProviderFactory:
 
         return None
 
+    @classmethod
+    def clear_detection_cache(cls) -> None:
+        """Forget cached provider detection so the environment is read again."""
+        cls._detected = None
+        cls._default_provider = None
+        cls._default_resolved = False
+
     @classmethod
     def get_provider(cls, provider: str | None = None, **kwargs) -> LLMProvider:
         """
@@ -1,15 +1,42 @@
 """Ollama provider implementation for local LLMs."""
 
+import functools
 import logging
 import os
+from collections.abc import AsyncIterator
+from typing import Any
 
 import httpx
 
 from ..core.exceptions import ProviderAPIError, ProviderConnectionError, format_provider_setup_help
-from .base import LLMProvider, LLMResponse
+from ..utils.serialization import dumps_json, loads_json
+from .base import _HTTP2, _HTTP_LIMITS, _SYSTEM_PROMPT, LLMProvider, LLMResponse
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@functools.cache
+def _get_encoding():
+    """Return the tiktoken encoding used to count tokens, or None if unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Not installed, or the encoding file can't be fetched (e.g. offline)
+        logger.debug("tiktoken unavailable; estimating Ollama token counts from words")
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """Count tokens in text, estimating from the word count without tiktoken."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return round(len(text.split()) * 1.3)
+    return len(encoding.encode(text, disallowed_special=()))
+
 
 class OllamaProvider(LLMProvider):
     """Ollama provider for local LLM inference."""
@@ -22,81 +49,143 @@ class OllamaProvider(LLMProvider):
             model: Model to use (default: qwen3:30b-a3b)
             base_url: Ollama API URL (uses OLLAMA_BASE_URL env var if not provided)
         """
-        super().__init__(model, api_key=None, **kwargs)
+        # Set before super().__init__, which calls validate_config
         self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+        super().__init__(model, api_key=None, **kwargs)
 
     @property
     def name(self) -> str:
         return "ollama"
 
-    async def complete(
-        self, prompt: str, temperature: float = 0.0, max_tokens: int = 1000, **kwargs
-    ) -> LLMResponse:
-        """Get completion from Ollama."""
-        try:
-            async with httpx.AsyncClient() as client:
-                # Prepare request
-                payload = {
-                    "model": self.model,
-                    "prompt": f"You are an expert evaluator.\n\n{prompt}",
-                    "temperature": temperature,
-                    "options": {
-                        "num_predict": max_tokens,
-                        "temperature": temperature,
-                    },
-                    "stream": False,
-                }
-
-                # Make request
-                response = await client.post(
-                    f"{self.base_url}/api/generate", json=payload, timeout=60.0
-                )
-
-                if response.status_code != 200:
-                    raise RuntimeError(
-                        f"Ollama API error: {response.status_code} - {response.text}"
-                    )
-
-                # Parse response
-                data = response.json()
-                content = data.get("response", "")
-
-                # Ollama doesn't provide token counts in the same way
-                # Estimate based on response length
-                estimated_tokens = len(content.split()) * 1.3
-                usage = {
-                    "prompt_tokens": len(prompt.split()) * 1.3,
-                    "completion_tokens": estimated_tokens,
-                    "total_tokens": len(prompt.split()) * 1.3 + estimated_tokens,
-                }
-
-                return LLMResponse(
-                    content=content,
-                    model=self.model,
-                    usage=usage,
-                    cost=0.0,  # Local inference has no API cost
-                    raw_response=data,
-                )
-
-        except httpx.ConnectError as e:
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url, http2=_HTTP2, timeout=60.0, limits=_HTTP_LIMITS
+        )
+
+    def _build_payload(
+        self, prompt: str, temperature: float, max_tokens: int, json_mode: bool | None
+    ) -> dict[str, Any]:
+        """Build a streaming /api/generate request body."""
+        payload = {
+            "model": self.model,
+            "prompt": f"{_SYSTEM_PROMPT}\n\n{prompt}",
+            "temperature": temperature,
+            "options": {
+                "num_predict": max_tokens,
+                "temperature": temperature,
+            },
+            "stream": True,
+        }
+        if json_mode:
+            payload["format"] = "json"
+        return payload
+
+    async def _generate(self, payload: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """Post a generate request and yield its NDJSON chunks as they arrive."""
+        # Reuse one client so calls share keep-alive connections
+        body = dumps_json(payload, indent=False)
+        async with self._get_client().stream(
+            "POST", "/api/generate", content=body, headers=_JSON_HEADERS
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise RuntimeError(f"Ollama API error: {response.status_code} - {response.text}")
+
+            async for line in response.aiter_lines():
+                if line:
+                    yield loads_json(line)
+
+    def _provider_error(self, error: Exception) -> Exception:
+        """Log an Ollama request failure and convert it to a provider error."""
+        if isinstance(error, httpx.ConnectError):
             logger.error(f"Cannot connect to Ollama at {self.base_url}")
-            raise ProviderConnectionError(
+            return ProviderConnectionError(
                 "ollama",
                 Exception(
                     f"Cannot connect to {self.base_url}. Make sure Ollama is running (ollama serve)."
                 ),
-            ) from e
+            )
 
-        except httpx.TimeoutException as e:
+        if isinstance(error, httpx.TimeoutException):
             logger.error("Ollama request timed out")
-            raise ProviderAPIError(
+            return ProviderAPIError(
                 "ollama",
                 error_message="Request timed out. The model may be loading or the response is taking too long.",
-            ) from e
+            )
+
+        logger.error(f"Unexpected Ollama error: {str(error)}")
+        return ProviderAPIError("ollama", error_message=str(error))
 
+    async def _complete_uncached(
+        self, prompt: str, temperature: float = 0.0, max_tokens: int = 1000, **kwargs
+    ) -> LLMResponse:
+        """Get completion from Ollama."""
+        payload = self._build_payload(prompt, temperature, max_tokens, kwargs.get("json_mode"))
+        parts = []
+        final: dict[str, Any] = {}
+        try:
+            async for chunk in self._generate(payload):
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    final = chunk
+        except Exception as e:
+            raise self._provider_error(e) from e
+
+        content = "".join(parts)
+
+        # The final chunk reports exact counts, but omits prompt_eval_count when the
+        # prompt was served from Ollama's cache; count with the tokenizer then
+        prompt_tokens = final.get("prompt_eval_count")
+        if prompt_tokens is None:
+            prompt_tokens = _count_tokens(payload["prompt"])
+        completion_tokens = final.get("eval_count")
+        if completion_tokens is None:
+            completion_tokens = _count_tokens(content)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+        return LLMResponse(
+            content=content,
+            model=self.model,
+            usage=usage,
+            cost=0.0,  # Local inference has no API cost
+            # Shaped like a non-streaming /api/generate response: the final chunk's
+            # metadata with the whole completion text
+            raw_response={**final, "response": content},
+        )
+
+    async def complete_stream(
+        self, prompt: str, temperature: float = 0.0, max_tokens: int = 1000, **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion from Ollama, yielding text as it is generated.
+
+        Streamed completions bypass the response cache.
+
+        Args:
+            prompt: The prompt to complete
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: ``json_mode=True`` constrains the output to JSON, and
+                ``cached_prefix`` is prepended to the prompt as in ``complete``
+
+        Yields:
+            Pieces of the completion text, in order
+        """
+        cached_prefix = kwargs.get("cached_prefix")
+        if cached_prefix:
+            prompt = cached_prefix + prompt
+        payload = self._build_payload(prompt, temperature, max_tokens, kwargs.get("json_mode"))
+        try:
+            async for chunk in self._generate(payload):
+                text = chunk.get("response")
+                if text:
+                    yield text
         except Exception as e:
-            logger.error(f"Unexpected Ollama error: {str(e)}")
-            raise ProviderAPIError("ollama", error_message=str(e)) from e
+            raise self._provider_error(e) from e
 
     def validate_config(self) -> None:
         """Validate Ollama configuration."""
@@ -117,8 +206,7 @@ class OllamaProvider(LLMProvider):
     async def check_connection(self) -> bool:
         """Check if Ollama server is reachable."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.base_url}/api/tags", timeout=5.0)
-                return response.status_code == 200
+            response = await self._get_client().get("/api/tags", timeout=5.0)
+            return response.status_code == 200
         except Exception:
             return False
@@ -3,6 +3,11 @@
 import logging
 import os
 
+try:
+    import openai
+except ImportError:
+    openai = None
+
 from ..core.exceptions import (
     ProviderAPIError,
     ProviderConnectionError,
@@ -10,14 +15,26 @@ from ..core.exceptions import (
     ProviderRateLimitError,
     format_provider_setup_help,
 )
-from .base import LLMProvider, LLMResponse
+from .base import (
+    _SDK_MAX_RETRIES,
+    _SDK_TIMEOUT,
+    _SYSTEM_PROMPT,
+    LLMProvider,
+    LLMResponse,
+    _shared_http_client,
+)
 
 logger = logging.getLogger(__name__)
 
+# Built once and shared by every request; only the user message varies per call
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI API provider."""
 
+    _USES_SHARED_HTTP = True
+
     # Pricing per 1K tokens (as of June 2025)
     PRICING = {
         # June 2025 Models
@@ -48,6 +65,12 @@ class OpenAIProvider(LLMProvider):
 
         # Initialize parent class (will call validate_config)
         super().__init__(model, api_key, **kwargs)
+
+        # Resolve the pricing entry once instead of scanning PRICING on every call
+        self._pricing = next(
+            (pricing for key, pricing in self.PRICING.items() if key in self.model), None
+        )
+
         self.api_base = api_base or os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
 
         # Import OpenAI library
@@ -57,19 +80,31 @@ class OpenAIProvider(LLMProvider):
     def name(self) -> str:
         return "openai"
 
-    async def complete(
+    def _create_client(self):
+        return self.openai.AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.api_base,
+            max_retries=_SDK_MAX_RETRIES,
+            timeout=_SDK_TIMEOUT,
+            http_client=_shared_http_client(),
+        )
+
+    async def _complete_uncached(
         self, prompt: str, temperature: float = 0.0, max_tokens: int = 1000, **kwargs
     ) -> LLMResponse:
         """Get completion from OpenAI."""
         try:
-            # Configure client
-            client = self.openai.AsyncOpenAI(api_key=self.api_key, base_url=self.api_base)
+            # Reuse one client so calls share keep-alive connections
+            client = self._get_client()
+
+            if kwargs.pop("json_mode", False):
+                kwargs["response_format"] = {"type": "json_object"}
 
             # Make request
             response = await client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "You are an expert evaluator."},
+                    _SYSTEM_MESSAGE,
                     {"role": "user", "content": prompt},
                 ],
                 temperature=temperature,
@@ -98,15 +133,15 @@ class OpenAIProvider(LLMProvider):
             retry_after = getattr(e, "retry_after", None)
             raise ProviderRateLimitError("openai", retry_after) from e
 
+        except self.openai.APIConnectionError as e:
+            logger.error(f"OpenAI connection error: {str(e)}")
+            raise ProviderConnectionError("openai", e) from e
+
         except self.openai.APIError as e:
             logger.error(f"OpenAI API error: {str(e)}")
             status_code = getattr(e, "status_code", None)
             raise ProviderAPIError("openai", status_code, str(e)) from e
 
-        except self.openai.APIConnectionError as e:
-            logger.error(f"OpenAI connection error: {str(e)}")
-            raise ProviderConnectionError("openai", e) from e
-
         except Exception as e:
             logger.error(f"Unexpected OpenAI error: {str(e)}")
             # Re-raise with more context
@@ -114,20 +149,14 @@ class OpenAIProvider(LLMProvider):
 
     def calculate_cost(self, usage: dict[str, int]) -> float:
         """Calculate cost based on OpenAI pricing."""
-        model_key = None
-        for key in self.PRICING:
-            if key in self.model:
-                model_key = key
-                break
-
-        if not model_key:
+        pricing = self._pricing
+        if pricing is None:
             return 0.0
 
-        pricing = self.PRICING[model_key]
-        input_cost = (usage.get("prompt_tokens", 0) / 1000) * pricing["input"]
-        output_cost = (usage.get("completion_tokens", 0) / 1000) * pricing["output"]
-
-        return input_cost + output_cost
+        return (
+            usage.get("prompt_tokens", 0) * pricing["input"]
+            + usage.get("completion_tokens", 0) * pricing["output"]
+        ) / 1000
 
     def validate_config(self) -> None:
         """Validate OpenAI configuration."""
@@ -155,16 +184,13 @@ class OpenAIProvider(LLMProvider):
             )
 
     def _import_openai(self) -> None:
-        """Import OpenAI library with helpful error message."""
-        try:
-            import openai
-
-            self.openai = openai
-        except ImportError:
+        """Bind the OpenAI library, with a helpful error if it isn't installed."""
+        if openai is None:
             raise ImportError(
                 "OpenAI provider requires 'openai' package.\n"
                 "Install with: pip install 'acp-evals[openai]' or pip install openai"
             )
+        self.openai = openai
 
     @classmethod
     def get_required_env_vars(cls) -> list[str]:
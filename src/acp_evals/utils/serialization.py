@@ -0,0 +1,85 @@
+"""JSON serialization helpers for ACP Evals exports."""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Exports can carry full agent traces, so write through a large buffer
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to JSON bytes.
+
+    Uses orjson when installed and falls back to the standard library.
+
+    Args:
+        data: JSON-serializable data (numpy values are supported with orjson)
+        indent: Indent with two spaces; otherwise emit compact single-line JSON
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(data: str | bytes) -> Any:
+    """
+    Parse a JSON document.
+
+    Uses orjson when installed and falls back to the standard library.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Parsed Python value
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path: str | Path, data: Any) -> None:
+    """
+    Write data to a JSON file in a single buffered write.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+    """
+    payload = dumps_json(data)
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(payload)
+
+
+async def write_json_async(path: str | Path, data: Any) -> None:
+    """
+    Write data to a JSON file without blocking the event loop.
+
+    Serialization and the file write run in a worker thread.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+    """
+    await asyncio.to_thread(write_json, path, data)
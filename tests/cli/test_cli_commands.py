@@ -14,6 +14,7 @@ import pytest
 from click.testing import CliRunner
 
 from acp_evals.cli.main import cli
+from acp_evals.cli.templates import TEMPLATES
 
 
 class TestCLICommands:
@@ -276,6 +277,35 @@ class TestWorkflowCommand:
         assert "handoff" in result.output
 
 
+class TestDiscoverCommand:
+    """Test agent discovery helpers."""
+
+    @pytest.mark.asyncio
+    async def test_agent_setup_failure_is_reported_not_raised(self, monkeypatch):
+        """A provider that fails to configure yields an error record, not an abort."""
+        import importlib
+
+        from acp_evals import api
+        from acp_evals.core.exceptions import ProviderNotConfiguredError
+
+        def unconfigured(**kwargs):
+            raise ProviderNotConfiguredError("openai", ["OPENAI_API_KEY"])
+
+        # The commands package re-exports the click command under the module's name
+        discover = importlib.import_module("acp_evals.cli.commands.discover")
+        monkeypatch.setattr(api, "AccuracyEval", unconfigured)
+        agents = [
+            {"name": "first", "url": "http://localhost:8001/agents/first"},
+            {"name": "second", "url": "http://localhost:8001/agents/second"},
+        ]
+
+        results = await discover.test_agents(agents, max_concurrency=2)
+
+        assert [result["name"] for result in results] == ["first", "second"]
+        assert all(result["status"] == "error" for result in results)
+        assert "OPENAI_API_KEY" in results[0]["error"]
+
+
 class TestTemplateQuality:
     """Test generated template quality by actually executing them."""
 
@@ -284,6 +314,20 @@ class TestTemplateQuality:
         self.runner = CliRunner()
         self.temp_dir = tempfile.mkdtemp()
 
+    @pytest.mark.parametrize("template", list(TEMPLATES))
+    def test_every_template_renders_valid_python(self, template):
+        """Test that init output compiles, with escaped braces rendered as single braces."""
+        template_file = os.path.join(self.temp_dir, f"{template.replace('-', '_')}_eval.py")
+
+        result = self.runner.invoke(
+            cli, ["init", template, "--name", "Test Agent", "--output", template_file]
+        )
+        assert result.exit_code == 0, result.output
+
+        content = Path(template_file).read_text()
+        compile(content, template_file, "exec")
+        assert "{{" not in content and "}}" not in content
+
     @pytest.mark.slow
     def test_simple_template_execution(self):
         """Test that generated simple template actually works."""
@@ -0,0 +1,45 @@
+"""
+Tests for the shared ACP client pool used by evaluators.
+"""
+
+import pytest
+
+from acp_evals.evaluators import common
+
+
+class FakeClient:
+    """Stand-in ACP client that counts how often it is closed."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.closed = 0
+
+    async def __aexit__(self, *exc_info):
+        self.closed += 1
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    monkeypatch.setattr(common, "Client", FakeClient)
+
+
+@pytest.mark.asyncio
+async def test_last_release_closes_shared_client(fake_client):
+    first = common._acquire_client("http://localhost:8000")
+    second = common._acquire_client("http://localhost:8000")
+    assert first is second
+
+    await common._release_client("http://localhost:8000", first)
+    assert first.closed == 0
+    await common._release_client("http://localhost:8000", second)
+    assert first.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_release_after_close_shared_clients_does_not_close_again(fake_client):
+    client = common._acquire_client("http://localhost:8000")
+
+    await common.close_shared_clients()
+    await common._release_client("http://localhost:8000", client)
+
+    assert client.closed == 1
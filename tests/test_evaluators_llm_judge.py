@@ -2,11 +2,62 @@
 Tests for LLMJudge evaluator - focusing on core functionality.
 """
 
+import asyncio
+import json
+
 import pytest
 
 from acp_evals.core.exceptions import InvalidEvaluationInputError
 from acp_evals.evaluators.common import EvalResult
-from acp_evals.evaluators.llm_judge import JudgeResult, LLMJudge
+from acp_evals.evaluators.llm_judge import JudgeResult, LLMJudge, _parse_json_verdict
+from acp_evals.providers.base import LLMProvider, LLMResponse
+
+
+class StubProvider(LLMProvider):
+    """Provider that scores by prompt content and records peak concurrency."""
+
+    def __init__(self, delay: float = 0.01, **kwargs):
+        super().__init__(model="stub", **kwargs)
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "stub"
+
+    @classmethod
+    def get_required_env_vars(cls) -> list[str]:
+        return []
+
+    async def _complete_uncached(self, prompt, temperature=0.0, max_tokens=1000, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        score = "0.9" if "Response: Paris" in prompt else "0.1"
+        if kwargs.get("json_mode"):
+            return LLMResponse(content=f'{{"score": {score}, "feedback": "stub"}}', model="stub")
+        return LLMResponse(content=f"Score: {score}\nFeedback: stub", model="stub")
+
+
+class PackedStubProvider(StubProvider):
+    """StubProvider that also answers packed multi-case prompts."""
+
+    async def _complete_uncached(self, prompt, temperature=0.0, max_tokens=1000, **kwargs):
+        if '"verdicts"' not in prompt:
+            return await super()._complete_uncached(prompt, temperature, max_tokens, **kwargs)
+        self.calls += 1
+        items = prompt.split("\n[")[1:]
+        verdicts = [
+            {"id": n, "score": 0.9 if "Response: Paris" in item else 0.1, "feedback": "stub"}
+            for n, item in enumerate(items, 1)
+        ]
+        return LLMResponse(content=json.dumps({"verdicts": verdicts}), model="stub")
 
 
 class TestLLMJudge:
@@ -71,3 +122,113 @@ class TestLLMJudge:
         # LLMJudge doesn't have pass_threshold, it's just a scoring engine
         judge = LLMJudge(rubric="code_quality")
         assert judge.rubric == "code_quality"
+
+
+class TestLLMJudgeBatch:
+    """Batch evaluation against a stub provider (no API access needed)."""
+
+    @pytest.mark.asyncio
+    async def test_batch_evaluate_preserves_order_and_bounds_concurrency(self):
+        provider = StubProvider()
+        judge = LLMJudge(provider=provider)
+        evaluations = [
+            {"prompt": f"Capital of France? #{i}", "response": r, "expected": "Paris"}
+            for i, r in enumerate(["Paris", "Lyon"] * 5)
+        ]
+
+        results = await judge.batch_evaluate(evaluations, max_concurrent=3)
+
+        assert [r.passed for r in results] == [True, False] * 5
+        assert provider.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_evaluate_streaming_stops_when_predicate_matches(self):
+        provider = StubProvider()
+        judge = LLMJudge(provider=provider)
+        evaluations = [
+            {"prompt": f"Q{i}", "response": "Paris" if i == 0 else "Rome", "expected": "Paris"}
+            for i in range(10)
+        ]
+
+        streamed = [
+            result
+            async for _, result in judge.batch_evaluate_streaming(
+                evaluations, max_concurrent=1, stop_when=lambda r: r.passed
+            )
+        ]
+
+        assert len(streamed) == 1 and streamed[0].passed
+        assert provider.calls < len(evaluations)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_evaluations_share_one_llm_call(self):
+        provider = StubProvider()
+        judge = LLMJudge(provider=provider)
+        case = {"prompt": "Capital of France?", "response": "Paris", "expected": "Paris"}
+
+        results = await judge.batch_evaluate([case] * 4)
+        again = await judge.evaluate(**case)
+
+        assert provider.calls == 1
+        assert all(r.score == again.score == 0.9 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_provider_cache_never_reuses_another_responses_verdict(self):
+        provider = StubProvider(response_cache=True, fuzzy_cache_threshold=0.85)
+        judge = LLMJudge(provider=provider)
+
+        paris = await judge.evaluate(
+            prompt="Capital of France?", response="Paris", expected="Paris"
+        )
+        rome = await judge.evaluate(prompt="Capital of France?", response="Rome", expected="Paris")
+
+        assert provider.calls == 2
+        assert paris.passed and not rome.passed
+
+    @pytest.mark.asyncio
+    async def test_empty_response_skips_llm_call(self):
+        provider = StubProvider()
+        judge = LLMJudge(provider=provider)
+
+        result = await judge.evaluate(prompt="Capital of France?", response="  ", expected="Paris")
+
+        assert provider.calls == 0
+        assert result.score == 0.0
+        assert result.passed is False
+
+    def test_parse_json_verdict(self):
+        """JSON verdicts parse and validate; line-format output is left to the fallback."""
+        fenced = '```json\n{"score": 0.8, "feedback": "close"}\n```'
+        assert _parse_json_verdict(fenced) == (0.8, "close")
+        assert _parse_json_verdict("Score: 0.8\nFeedback: close") is None
+        with pytest.raises(ValueError):
+            _parse_json_verdict('{"score": "high", "feedback": "close"}')
+
+    @pytest.mark.asyncio
+    async def test_batch_evaluate_packed_uses_one_call_per_pack(self):
+        provider = PackedStubProvider()
+        judge = LLMJudge(provider=provider)
+        cases = [
+            {"prompt": f"Question {i}", "response": "Paris" if i % 2 else "Rome", "expected": "x"}
+            for i in range(7)
+        ]
+
+        results = await judge.batch_evaluate_packed(cases, pack_size=3)
+
+        assert provider.calls == 3
+        assert [r.score for r in results] == [0.1, 0.9, 0.1, 0.9, 0.1, 0.9, 0.1]
+
+    @pytest.mark.asyncio
+    async def test_batch_evaluate_packed_falls_back_per_item(self):
+        provider = StubProvider()
+        judge = LLMJudge(provider=provider)
+        cases = [
+            {"prompt": "Capital of France?", "response": "Paris", "expected": "Paris"},
+            {"prompt": "Capital of Italy?", "response": "Paris", "expected": "Rome"},
+        ]
+
+        results = await judge.batch_evaluate_packed(cases)
+
+        # One unusable packed reply, then one call per case
+        assert provider.calls == 3
+        assert [r.score for r in results] == [0.9, 0.9]
@@ -0,0 +1,258 @@
+"""
+Tests for the LLMProvider base class - response caching and cost helpers.
+"""
+
+import asyncio
+
+import pytest
+
+from acp_evals.providers import base
+from acp_evals.providers.base import LLMProvider, LLMResponse
+
+
+class CountingProvider(LLMProvider):
+    """Provider that echoes each prompt and counts upstream requests."""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("response_cache", True)
+        super().__init__(model="counting", **kwargs)
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "counting"
+
+    @classmethod
+    def get_required_env_vars(cls) -> list[str]:
+        return []
+
+    async def _complete_uncached(self, prompt, temperature=0.0, max_tokens=1000, **kwargs):
+        self.calls += 1
+        return LLMResponse(
+            content=f"{prompt} #{self.calls}", model=self.model, usage={"input_tokens": 1}
+        )
+
+
+def test_provider_without_complete_uncached_is_abstract():
+    class Incomplete(LLMProvider):
+        @property
+        def name(self) -> str:
+            return "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete(model="incomplete")
+
+
+def test_provider_overriding_complete_still_works():
+    class Legacy(LLMProvider):
+        @property
+        def name(self) -> str:
+            return "legacy"
+
+        @classmethod
+        def get_required_env_vars(cls) -> list[str]:
+            return []
+
+        async def complete(self, prompt, temperature=0.0, max_tokens=1000, **kwargs):
+            return LLMResponse(content=prompt.upper(), model=self.model)
+
+    provider = Legacy(model="legacy", response_cache=True)
+
+    assert asyncio.run(provider.complete("hi")).content == "HI"
+
+
+class TestResponseCache:
+    """LLMProvider.complete's exact-match response cache."""
+
+    @pytest.mark.asyncio
+    async def test_cache_is_off_unless_enabled(self):
+        provider = CountingProvider(response_cache=False)
+
+        await provider.complete("What is 2+2?")
+        again = await provider.complete("What is 2+2?")
+
+        assert provider.calls == 2
+        assert again.cache_kind is None
+
+    @pytest.mark.asyncio
+    async def test_hits_are_copies(self):
+        provider = CountingProvider()
+
+        first = await provider.complete("What is 2+2?")
+        first.content = "changed"
+        second = await provider.complete("What is 2+2?")
+        second.usage["input_tokens"] = 99
+        third = await provider.complete("What is 2+2?")
+
+        assert second.content == "What is 2+2? #1"
+        assert third.usage == {"input_tokens": 1}
+
+    @pytest.mark.asyncio
+    async def test_exact_hit_is_served_from_cache(self):
+        provider = CountingProvider()
+
+        first = await provider.complete("What is 2+2?")
+        second = await provider.complete("What is 2+2?")
+
+        assert provider.calls == 1
+        assert first.cache_kind is None
+        assert second.cache_kind == "exact"
+        assert second.content == first.content
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self, monkeypatch):
+        monkeypatch.setenv("EVALUATION_CACHE_TTL", "0")
+        provider = CountingProvider()
+
+        await provider.complete("What is 2+2?")
+        again = await provider.complete("What is 2+2?")
+
+        assert provider.calls == 2
+        assert again.cache_kind is None
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, monkeypatch):
+        monkeypatch.setattr(base, "_RESPONSE_CACHE_SIZE", 2)
+        provider = CountingProvider()
+
+        await provider.complete("a")
+        await provider.complete("b")
+        await provider.complete("a")  # Hit; "b" is now the oldest entry
+        await provider.complete("c")  # Evicts "b"
+        assert provider.calls == 3
+
+        assert (await provider.complete("a")).cache_kind == "exact"
+        assert (await provider.complete("b")).cache_kind is None
+        assert provider.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_cache_is_skipped_when_disabled_or_sampling(self):
+        provider = CountingProvider()
+
+        await provider.complete("a", cache=False)
+        await provider.complete("a", cache=False)
+        await provider.complete("b", temperature=0.7)
+        await provider.complete("b", temperature=0.7)
+
+        assert provider.calls == 4
+        assert provider.cache_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_stats_counts_hits_and_misses(self):
+        provider = CountingProvider()
+
+        await provider.complete("a")
+        await provider.complete("a")
+        await provider.complete("a")
+        await provider.complete("b")
+
+        assert provider.cache_stats() == {"hits": 2, "fuzzy_hits": 0, "misses": 2, "size": 2}
+
+
+class TestFuzzyCache:
+    """Opt-in near-duplicate matching in LLMProvider.complete."""
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_prompt_is_served_fuzzily(self):
+        provider = CountingProvider(fuzzy_cache_threshold=0.85)
+
+        first = await provider.complete("Summarize the report in one short paragraph, please.")
+        second = await provider.complete("summarize the report in one short paragraph please")
+
+        assert provider.calls == 1
+        assert second.cache_kind == "fuzzy"
+        assert second.content == first.content
+        assert provider.cache_stats()["fuzzy_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_json_mode_requests_only_match_exactly(self):
+        provider = CountingProvider(fuzzy_cache_threshold=0.85)
+
+        await provider.complete("Summarize the report in one short paragraph.", json_mode=True)
+        second = await provider.complete(
+            "summarize the report in one short paragraph", json_mode=True
+        )
+
+        assert provider.calls == 2
+        assert second.cache_kind is None
+
+
+class SlowProvider(CountingProvider):
+    """CountingProvider whose requests take a while and record peak concurrency."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _complete_uncached(self, prompt, temperature=0.0, max_tokens=1000, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            # Later prompts finish first, so results arrive out of order
+            await asyncio.sleep(0.01 / (int(prompt) + 1))
+            if prompt == "3":
+                raise RuntimeError("upstream failed")
+            return await super()._complete_uncached(prompt, temperature, max_tokens, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+class TestCompleteMany:
+    """LLMProvider.complete_many fans prompts out under a concurrency cap."""
+
+    @pytest.mark.asyncio
+    async def test_results_and_errors_keep_prompt_order(self):
+        provider = SlowProvider()
+        prompts = [str(i) for i in range(6)]
+
+        results = await provider.complete_many(prompts, concurrency=6)
+
+        for prompt, result in zip(prompts, results):
+            if prompt != "3":
+                assert result.content.startswith(f"{prompt} #")
+        assert isinstance(results[3], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_is_respected(self):
+        provider = SlowProvider()
+
+        await provider.complete_many([str(i) for i in range(8)], concurrency=2)
+
+        assert provider.peak == 2
+        assert provider.calls == 7
+
+    @pytest.mark.asyncio
+    async def test_default_limit_comes_from_env(self, monkeypatch):
+        monkeypatch.setenv("EVALUATION_MAX_CONCURRENCY", "3")
+        provider = SlowProvider()
+
+        await provider.complete_many([str(i) for i in range(8)])
+
+        assert provider.peak == 3
+
+
+class PricedProvider(CountingProvider):
+    """CountingProvider with linear per-token pricing."""
+
+    def calculate_cost(self, usage: dict[str, int]) -> float:
+        return usage.get("input_tokens", 0) * 0.001 + usage.get("output_tokens", 0) * 0.002
+
+
+class TestBulkCost:
+    """LLMProvider.bulk_cost prices many usage dicts at once."""
+
+    def test_matches_summed_per_response_costs(self):
+        provider = PricedProvider()
+        usages = [
+            {"input_tokens": 100, "output_tokens": 20},
+            {"input_tokens": 50},
+            {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        ]
+
+        expected = sum(provider.calculate_cost(usage) for usage in usages)
+
+        assert provider.bulk_cost(usages) == pytest.approx(expected)
+
+    def test_empty_usages_cost_nothing(self):
+        assert PricedProvider().bulk_cost([]) == 0.0
@@ -0,0 +1,50 @@
+"""
+Tests for the Ollama provider's streamed /api/generate handling.
+"""
+
+import pytest
+
+from acp_evals.providers.ollama_provider import OllamaProvider
+
+CHUNKS = [
+    {"response": "Hello", "done": False},
+    {"response": " world", "done": False},
+    {"response": "", "done": True, "prompt_eval_count": 12, "eval_count": 2},
+]
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    provider = OllamaProvider(model="test-model")
+    provider.payloads = []
+
+    async def fake_generate(payload):
+        provider.payloads.append(payload)
+        for chunk in CHUNKS:
+            yield chunk
+
+    monkeypatch.setattr(provider, "_generate", fake_generate)
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_complete_assembles_streamed_chunks(provider):
+    response = await provider.complete("Say hello")
+
+    assert response.content == "Hello world"
+    assert response.usage == {"prompt_tokens": 12, "completion_tokens": 2, "total_tokens": 14}
+    assert response.raw_response["response"] == "Hello world"
+    assert response.raw_response["done"] is True
+
+
+@pytest.mark.asyncio
+async def test_stream_and_complete_send_the_same_prompt(provider):
+    await provider.complete("Say hello", cached_prefix="Rubric\n")
+    streamed = [
+        text async for text in provider.complete_stream("Say hello", cached_prefix="Rubric\n")
+    ]
+
+    assert streamed == ["Hello", " world"]
+    complete_payload, stream_payload = provider.payloads
+    assert stream_payload["prompt"] == complete_payload["prompt"]
+    assert "Rubric\nSay hello" in stream_payload["prompt"]